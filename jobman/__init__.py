@@ -1,8 +1,35 @@
-from .core.install_completions import install_completions
-from .core.kill import kill
-from .core.logs import logs
-from .core.ls import ls
-from .core.purge import purge
-from .core.reset import reset
-from .core.status import status
-from .core.supervisor.run import build_job, run_job
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.install_completions import install_completions
+    from .core.kill import kill
+    from .core.logs import logs
+    from .core.ls import ls
+    from .core.purge import purge
+    from .core.reset import reset
+    from .core.status import status
+    from .core.supervisor.run import build_job, run_job
+
+# public name -> module defining it. Modules are imported on first access
+# (PEP 562) so that importing jobman, e.g. to start the CLI, stays cheap
+_LAZY_ATTRS = {
+    "install_completions": ".core.install_completions",
+    "kill": ".core.kill",
+    "logs": ".core.logs",
+    "ls": ".core.ls",
+    "purge": ".core.purge",
+    "reset": ".core.reset",
+    "status": ".core.status",
+    "build_job": ".core.supervisor.run",
+    "run_job": ".core.supervisor.run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = attr
+    return attr
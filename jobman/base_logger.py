@@ -1,16 +1,53 @@
 """Defines a single instance of a logging.logger used across jobman modules.
 """
+
 import logging
+import time
+from typing import Optional
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time portion of asctime once per second
+    rather than once per record.
+    """
+
+    def __init__(self, fmt: Optional[str] = None) -> None:
+        super().__init__(fmt)
+        self._last_sec = -1
+        self._last_sec_str = ""
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_sec_str = time.strftime(
+                self.default_time_format, self.converter(sec)
+            )
+        return f"{self._last_sec_str},{int(record.msecs):03d}"
 
 
 def make_logger(log_level: int = logging.WARN) -> logging.Logger:
+    logger = logging.getLogger("jobman")
+    logger.setLevel(log_level)
+    if logger.handlers:
+        # already configured by an earlier call in this process; adding
+        # another handler would emit every record once per call
+        return logger
+
     handler = logging.StreamHandler()
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     handler.setFormatter(formatter)
-    logger = logging.getLogger("jobman")
-    logger.setLevel(log_level)
+
+    # records are fully handled here, so skip the walk up to the root logger
+    logger.propagate = False
     logger.addHandler(handler)
 
     return logger
@@ -1,72 +1,115 @@
+from __future__ import annotations
+
+import importlib
 import logging
 import os
-import re
 import sys
 from datetime import datetime, time, timedelta
-from functools import wraps
+from functools import lru_cache
 from pathlib import Path
 from signal import Signals
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from time import time as epoch_time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import click
 
 from .base_logger import make_logger
 from .config import load_config
-from .core.install_completions import display_install_completions
-from .core.kill import display_kill
-from .core.logs import display_logs
-from .core.ls import display_ls, ls
-from .core.purge import display_purge
-from .core.reset import display_reset
-from .core.run import display_run
-from .core.status import display_status
-from .display import RichDisplayer
+from .display import Displayer, JsonDisplayer, RichDisplayer
 from .exceptions import JobmanError
-from .gc import bg_gc_logs
 
 
+TIMEDELTA_UNITS = {
+    "w": "weeks",
+    "d": "days",
+    "h": "hours",
+    "m": "minutes",
+    "s": "seconds",
+}
+
+
+@lru_cache(maxsize=256)
 def strptimedelta(td_str: str) -> timedelta:
-    durations = {}
-    td_str_work = td_str
-    for unit in ["w", "d", "h", "m", "s"]:
-        unit_v = re.findall(f"(\d+){unit}", td_str_work)
-        if not unit_v:
-            durations[unit] = 0
-        elif len(unit_v) > 1:
+    values: Dict[str, List[str]] = {unit: [] for unit in TIMEDELTA_UNITS}
+    unmatched = []
+    i, n = 0, len(td_str)
+    while i < n:
+        if not td_str[i].isdecimal():
+            unmatched.append(td_str[i])
+            i += 1
+            continue
+
+        # consume a run of digits, which is a value only if a unit follows it
+        j = i + 1
+        while j < n and td_str[j].isdecimal():
+            j += 1
+        if j == n or td_str[j] not in TIMEDELTA_UNITS:
+            unmatched.append(td_str[i:j])
+            i = j
+            continue
+
+        # only the value's canonical digits are taken with the unit, so any
+        # leading zeros, or the whole value if written in non-ASCII digits,
+        # are left over as uninterpretable
+        try:
+            digits = str(int(td_str[i:j]))
+        except ValueError:
+            # more digits than int() will convert
+            raise JobmanError(
+                f"Can't convert '{td_str}' to timedelta. '{td_str[i:j]}' must be an"
+                " integer.",
+                exit_code=os.EX_USAGE,
+            )
+        if td_str[i:j].endswith(digits):
+            unmatched.append(td_str[i : j - len(digits)])
+        else:
+            unmatched.append(td_str[i : j + 1])
+        values[td_str[j]].append(digits)
+        i = j + 1
+
+    durations: Dict[str, int] = {}
+    for unit, unit_values in values.items():
+        if len(unit_values) > 1:
             raise JobmanError(
                 f"Can't convert '{td_str}' to timedelta. Got multiple values for"
                 f" '{unit}'",
                 exit_code=os.EX_USAGE,
             )
-        else:
-            try:
-                v = int(unit_v[0])
-            except ValueError:
-                raise JobmanError(
-                    f"Can't convert '{td_str}' to timedelta. '{unit_v[0]}' must be an"
-                    " integer.",
-                    exit_code=os.EX_USAGE,
-                )
-            durations[unit] = v
-            td_str_work = td_str_work.replace(f"{v}{unit}", "")
-    if td_str_work.strip():
+        if unit_values:
+            durations[TIMEDELTA_UNITS[unit]] = int(unit_values[0])
+
+    uninterpretable = "".join(unmatched).strip()
+    if uninterpretable:
         raise JobmanError(
             f"Can't convert '{td_str}' to timedelta. Got uninterpretable characters"
-            f" '{td_str_work.strip()}'",
+            f" '{uninterpretable}'",
+            exit_code=os.EX_USAGE,
+        )
+
+    try:
+        return timedelta(**durations)
+    except OverflowError:
+        raise JobmanError(
+            f"Can't convert '{td_str}' to timedelta. Duration is too large",
             exit_code=os.EX_USAGE,
         )
-    return timedelta(
-        weeks=durations["w"],
-        days=durations["d"],
-        hours=durations["h"],
-        minutes=durations["m"],
-        seconds=durations["s"],
-    )
 
 
 def complete_job_id(
     ctx: click.Context, param: Optional[click.Parameter], incomplete: str
 ) -> List[str]:
+    from .core.ls import ls
+
     try:
         config = load_config()
         logger = make_logger(DEBUG_TO_LEVEL[False])
@@ -98,8 +141,36 @@ def complete_job_id(
         return []
 
 
+# subcommand name -> (module, function) implementing its display. Modules are
+# imported only when their subcommand is dispatched to keep startup fast
+DISPLAY_FNS: Dict[str, Tuple[str, str]] = {
+    "run": (".core.run", "display_run"),
+    "status": (".core.status", "display_status"),
+    "logs": (".core.logs", "display_logs"),
+    "kill": (".core.kill", "display_kill"),
+    "ls": (".core.ls", "display_ls"),
+    "purge": (".core.purge", "display_purge"),
+    "reset": (".core.reset", "display_reset"),
+    "install-completions": (
+        ".core.install_completions",
+        "display_install_completions",
+    ),
+}
+
+
+# run GC in background during read-only commands
+GC_COMMANDS = frozenset({"logs", "ls", "status"})
+
+
+def load_display_fn(command_name: str) -> Callable[..., int]:
+    module_name, fn_name = DISPLAY_FNS[command_name]
+    module = importlib.import_module(module_name, __package__)
+    fn: Callable[..., int] = getattr(module, fn_name)
+    return fn
+
+
 def cli_exec(  # type: ignore[no-untyped-def]
-    fn: Callable[..., int],
+    command_name: str,
     quiet: bool,
     json: bool,
     plain: bool,
@@ -107,7 +178,11 @@ def cli_exec(  # type: ignore[no-untyped-def]
     *args,
 ) -> None:
     try:
-        displayer = RichDisplayer(quiet, json, plain)
+        displayer: Displayer = (
+            JsonDisplayer(quiet)
+            if json and not plain
+            else RichDisplayer(quiet, json, plain)
+        )
     except JobmanError as e:
         # can't use the displayer to render the error message if we can't
         # initialize the displayer itself
@@ -116,8 +191,10 @@ def cli_exec(  # type: ignore[no-untyped-def]
     try:
         config = load_config()
         logger = make_logger(DEBUG_TO_LEVEL[debug])
-        if fn in [display_logs, display_ls, display_status]:
-            # run GC in background during read-only commands
+        fn = load_display_fn(command_name)
+        if command_name in GC_COMMANDS:
+            from .gc import bg_gc_logs
+
             bg_gc_logs(config, logger)
         sys.exit(fn(*args, config, displayer, logger))
     except JobmanError as e:
@@ -143,27 +220,154 @@ class TimedeltaType(click.ParamType):
             self.fail(str(e))
 
 
+@lru_cache(maxsize=256)
+def parse_time_or_datetime(
+    value: str, formats: Tuple[str, ...]
+) -> Union[time, datetime]:
+    """
+    Parse value as an ISO format datetime or time, or else as a datetime in one
+    of formats. Times are returned without a date so that callers can apply the
+    current day.
+    """
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    else:
+        # jobman compares against naive local times, so convert any offset
+        if dt.tzinfo is not None:
+            dt = dt.astimezone().replace(tzinfo=None)
+        return dt
+
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        pass
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(
+        f"{value!r} is not a time or does not match the formats"
+        f" {', '.join(map(repr, formats))}."
+    )
+
+
+@lru_cache(maxsize=1)
+def today_midnight(epoch_minute: int) -> datetime:
+    """
+    Start of the current day. Keyed on the minute since the epoch so repeated
+    calls within a minute reuse the same result.
+    """
+    return datetime.fromtimestamp(epoch_minute * 60).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
 class TimeOrDateTime(click.DateTime):
     def convert(
-        self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
+        self,
+        value: Union[str, datetime],
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
     ) -> datetime:
-        today = datetime.today()
+        if isinstance(value, datetime):
+            return value
+
         try:
-            tm = time.fromisoformat(value)
-        except ValueError:
-            dt: datetime = super().convert(value, param, ctx)
-            return dt
+            parsed = parse_time_or_datetime(value, tuple(self.formats))
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+        if isinstance(parsed, datetime):
+            return parsed
 
-        return today.replace(
-            hour=tm.hour, minute=tm.minute, second=tm.second, microsecond=0
+        return today_midnight(int(epoch_time() // 60)).replace(
+            hour=parsed.hour, minute=parsed.minute, second=parsed.second
         )
 
 
+@lru_cache(maxsize=1)
+def get_signals() -> Tuple[str, ...]:
+    """
+    Names (e.g., SIGINT) and numbers (e.g., 2) of all signals.
+    """
+    names, numbers = [], []
+    for s in Signals:
+        names.append(s.name)
+        numbers.append(str(s.value))
+    return (*names, *numbers)
+
+
+@lru_cache(maxsize=1)
+def _get_signal_set() -> FrozenSet[str]:
+    return frozenset(get_signals())
+
+
+class SignalChoice(click.Choice):
+    """
+    A click Choice of signal names and numbers, with valid values checked
+    against a set before falling back to click's own matching. The signals are
+    enumerated on construction, so it's only instantiated by the kill command.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(get_signals(), case_sensitive=True)
+
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> Any:
+        if value in _get_signal_set():
+            return value
+        return super().convert(value, param, ctx)
+
+
+# param types are stateless, so each is shared across all options using it
+TIMEDELTA = TimedeltaType()
+TIME_OR_DATETIME = TimeOrDateTime()
+NON_NEGATIVE_INT = click.IntRange(min=0)
+EXIT_CODE = click.IntRange(min=0, max=255)
+FILE_PATH = click.Path(path_type=Path)
+
+
+# subcommand name -> (module, click command). Modules are imported only when
+# their subcommand is looked up, so only the invoked command gets built
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "run": (".commands.run", "cli_run"),
+    "status": (".commands.status", "cli_status"),
+    "logs": (".commands.logs", "cli_logs"),
+    "kill": (".commands.kill", "cli_kill"),
+    "ls": (".commands.ls", "cli_ls"),
+    "purge": (".commands.purge", "cli_purge"),
+    "reset": (".commands.reset", "cli_reset"),
+    "install-completions": (
+        ".commands.install_completions",
+        "cli_install_completions",
+    ),
+}
+
+
 class JobmanGroup(click.Group):
     """
-    Typical click Group class, but displays the usage epilog without an indent.
+    Typical click Group class, but loads subcommands lazily from COMMANDS and
+    displays the usage epilog without an indent.
     """
 
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *COMMANDS])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, command_name = COMMANDS[cmd_name]
+        module = importlib.import_module(module_name, __package__)
+        command: click.Command = getattr(module, command_name)
+        return command
+
     def format_epilog(
         self, ctx: Optional[click.Context], formatter: click.HelpFormatter
     ) -> None:
@@ -205,505 +409,51 @@ T = TypeVar("T")
 R = TypeVar("R")
 
 
-def global_options(f: Callable[..., R]) -> Callable[..., Callable[..., R]]:
-    @wraps(f)
-    @click.option(
-        "-q", "--quiet", is_flag=True, default=False, help="Suppress unnecessary output"
-    )
-    @click.option(
-        "-j",
-        "--json",
-        is_flag=True,
-        default=False,
-        help=(
-            "Show output in machine-readable JSON format. Mutually exclusive with"
-            " -p/--plain"
+def global_options(f: Callable[..., R]) -> Callable[..., R]:
+    """
+    Attach the options shared by all subcommands directly to f.
+    """
+    options = [
+        click.option(
+            "-q",
+            "--quiet",
+            is_flag=True,
+            default=False,
+            help="Suppress unnecessary output",
         ),
-    )
-    @click.option(
-        "-p",
-        "--plain",
-        is_flag=True,
-        default=False,
-        help=(
-            "Show output in plain machine-readable format. Mutually exclusive with"
-            " -j/--json"
+        click.option(
+            "-j",
+            "--json",
+            is_flag=True,
+            default=False,
+            help=(
+                "Show output in machine-readable JSON format. Mutually exclusive with"
+                " -p/--plain"
+            ),
         ),
-    )
-    @click.option(
-        "-d",
-        "--debug",
-        is_flag=True,
-        default=False,
-        help="Show detailed debugging logs",
-    )
-    def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
-        return f(*args, **kwargs)
-
-    return wrapper
-
-
-@cli.command("run", context_settings=CONTEXT_SETTINGS)
-@click.argument("command", nargs=-1, required=True)
-@click.option(
-    "--wait-time",
-    type=TimeOrDateTime(),
-    help="Do not run the command until the specified date or time",
-)
-@click.option(
-    "--wait-duration",
-    type=TimedeltaType(),
-    help="Do not run the command until the specified duration has elapsed",
-)
-@click.option(
-    "--wait-for-file",
-    "wait_for_files",
-    type=click.Path(),
-    multiple=True,
-    help="Do not run the command until the specified file exists",
-)
-@click.option(
-    "--abort-time",
-    type=TimeOrDateTime(),
-    help="Terminate the command if it's still running at the specified time",
-)
-@click.option(
-    "--abort-duration",
-    type=TimedeltaType(),
-    help=(
-        "Terminate the command if it's still running after the specified duration has"
-        " elapsed"
-    ),
-)
-@click.option(
-    "--abort-for-file",
-    "abort_for_files",
-    type=click.Path(),
-    multiple=True,
-    help="Terminate the command if it's still running and the specified file exists",
-)
-@click.option(
-    "--retry-attempts",
-    type=click.IntRange(min=0),
-    help="If the command fails, rerun the command up to the specified number",
-)
-@click.option(
-    "--retry-delay",
-    type=TimedeltaType(),
-    help="Wait the specified time before starting retries",
-)
-@click.option(
-    "-e",
-    "--retry-expo-backoff",
-    is_flag=True,
-    default=False,
-    help="Exponentially increase delay between retries",
-)
-@click.option(
-    "-t",
-    "--retry-jitter",
-    is_flag=True,
-    default=False,
-    help=(
-        "Add extra delay between retries randomly selected uniform over the range -1 *"
-        " (retry-delay / 10) to (retry-delay / 10)"
-    ),
-)
-@click.option(
-    "-c",
-    "--success-code",
-    "success_codes",
-    type=click.IntRange(min=0, max=255),
-    multiple=True,
-    default=[0],
-    show_default=True,
-    help="Interpret these exit codes as a successful execution",
-)
-@click.option(
-    "--notify-on-job-completion",
-    type=str,
-    multiple=True,
-    help="Send a notification to this callback when the job completes",
-)
-@click.option(
-    "--notify-on-run-completion",
-    type=str,
-    multiple=True,
-    help="Send a notification to this callback when any run of the job completes",
-)
-@click.option(
-    "--notify-on-job-success",
-    type=str,
-    multiple=True,
-    help="Send a notification to this callback when the job completes successfully",
-)
-@click.option(
-    "--notify-on-run-success",
-    type=str,
-    multiple=True,
-    help=(
-        "Send a notification to this callback when any run of the job completes"
-        " successfully"
-    ),
-)
-@click.option(
-    "--notify-on-job-failure",
-    type=str,
-    multiple=True,
-    help="Send a notification to this callback when the job fails",
-)
-@click.option(
-    "--notify-on-run-failure",
-    type=str,
-    multiple=True,
-    help="Send a notification to this callback when a run of the job fails",
-)
-@click.option(
-    "-f",
-    "--follow",
-    is_flag=True,
-    default=False,
-    help="Display a running log of the command's output",
-)
-@global_options
-def cli_run(
-    command: Tuple[str, ...],
-    wait_time: Optional[datetime],
-    wait_duration: Optional[timedelta],
-    wait_for_files: Optional[Tuple[Path]],
-    abort_time: Optional[datetime],
-    abort_duration: Optional[timedelta],
-    abort_for_files: Optional[Tuple[Path]],
-    retry_attempts: Optional[int],
-    retry_delay: Optional[timedelta],
-    retry_expo_backoff: bool,
-    retry_jitter: bool,
-    success_codes: Tuple[int],
-    notify_on_run_completion: Optional[Tuple[str]],
-    notify_on_job_completion: Optional[Tuple[str]],
-    notify_on_job_success: Optional[Tuple[str]],
-    notify_on_run_success: Optional[Tuple[str]],
-    notify_on_job_failure: Optional[Tuple[str]],
-    notify_on_run_failure: Optional[Tuple[str]],
-    follow: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Start a job in the background immune to hangups."""
-    cli_exec(
-        display_run,
-        quiet,
-        json,
-        plain,
-        debug,
-        command,
-        wait_time,
-        wait_duration,
-        wait_for_files,
-        abort_time,
-        abort_duration,
-        abort_for_files,
-        retry_attempts,
-        retry_delay,
-        retry_expo_backoff,
-        retry_jitter,
-        success_codes,
-        notify_on_run_completion,
-        notify_on_job_completion,
-        notify_on_job_success,
-        notify_on_run_success,
-        notify_on_job_failure,
-        notify_on_run_failure,
-        follow,
-    )
-
-
-@cli.command("status", context_settings=CONTEXT_SETTINGS)
-@click.argument("job-ids", nargs=-1, required=True, shell_complete=complete_job_id)
-@click.option(
-    "-n",
-    "--no-runs",
-    is_flag=True,
-    default=False,
-    help="Don't show details of individual runs",
-)
-@click.option(
-    "-a",
-    "--all",
-    "all_",
-    is_flag=True,
-    default=False,
-    help="Display all job properties",
-)
-@global_options
-def cli_status(
-    job_ids: Tuple[str, ...],
-    no_runs: bool,
-    all_: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Display the status of a job(s) JOB_IDS."""
-    cli_exec(display_status, quiet, json, plain, debug, job_ids, no_runs, all_)
-
-
-@cli.command("logs", context_settings=CONTEXT_SETTINGS)
-@click.argument("job-id", nargs=1, shell_complete=complete_job_id)
-@click.option(
-    "-o",
-    "--hide-stdout",
-    is_flag=True,
-    default=False,
-    help="Don't display job's stdout",
-)
-@click.option(
-    "-e",
-    "--hide-stderr",
-    is_flag=True,
-    default=False,
-    help="Don't display job's stderr",
-)
-@click.option(
-    "-f",
-    "--follow",
-    is_flag=True,
-    default=False,
-    help="Display running log messages as output",
-)
-@click.option(
-    "-x",
-    "--no-log-prefix",
-    is_flag=True,
-    default=False,
-    help="Don't display leading log timestamp info",
-)
-@click.option(
-    "-n",
-    "--tail",
-    type=click.IntRange(min=0),
-    help="Show only the last n lines of log output",
-)
-@click.option(
-    "-s", "--since", type=TimeOrDateTime(), help="Don't show logs before this datetime"
-)
-@click.option(
-    "-u", "--until", type=TimeOrDateTime(), help="Don't show logs after this datetime"
-)
-@global_options
-def cli_logs(
-    job_id: str,
-    hide_stdout: bool,
-    hide_stderr: bool,
-    follow: bool,
-    no_log_prefix: bool,
-    tail: Optional[int],
-    since: Optional[datetime],
-    until: Optional[datetime],
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Show output from job JOB_ID."""
-    cli_exec(
-        display_logs,
-        quiet,
-        json,
-        plain,
-        debug,
-        job_id,
-        hide_stdout,
-        hide_stderr,
-        follow,
-        no_log_prefix,
-        tail,
-        since,
-        until,
-    )
-
-
-SIGNALS = [s.name for s in Signals] + [str(s.value) for s in Signals]
-
-
-@cli.command("kill", context_settings=CONTEXT_SETTINGS)
-@click.argument("job-id", nargs=-1, required=True, shell_complete=complete_job_id)
-@click.option(
-    "-s",
-    "--signal",
-    type=click.Choice(SIGNALS),
-    default="SIGINT",
-    show_default=True,
-    help=(
-        "Name (e.g., SIGINT) or integer number (e.g., 2) of signal to send to job"
-        " process"
-    ),
-)
-@click.option(
-    "-r",
-    "--allow-retries",
-    is_flag=True,
-    default=False,
-    help="Don't stop future retries from running if retries remain for the job",
-)
-@click.option(
-    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
-)
-@global_options
-def cli_kill(
-    job_ids: Tuple[str, ...],
-    signal: str,
-    allow_retries: bool,
-    force: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Stop running job JOB_IDS."""
-    multiple = len(job_ids) > 1
-    if not force:
-        click.confirm(
-            "⚠️  Are you sure you want to stop"
-            f" job{'s' if multiple else ''} {', '.join(job_ids)}?",
-            abort=True,
-        )
-    cli_exec(display_kill, quiet, json, plain, debug, job_ids, signal, allow_retries)
-
-
-@cli.command("ls", context_settings=CONTEXT_SETTINGS)
-@click.option(
-    "-a", "--all", "all_", is_flag=True, default=False, help="Include finished jobs"
-)
-@click.option(
-    "-r",
-    "--show-runs",
-    is_flag=True,
-    default=False,
-    help="Show details of individual runs",
-)
-@global_options
-def cli_ls(
-    all_: bool,
-    show_runs: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """View jobs."""
-    cli_exec(display_ls, quiet, json, plain, debug, all_, show_runs)
-
-
-@cli.command("purge", context_settings=CONTEXT_SETTINGS)
-@click.argument("job-ids", nargs=-1, required=False, shell_complete=complete_job_id)
-@click.option(
-    "-a",
-    "--all",
-    "_all",
-    is_flag=True,
-    default=False,
-    help="Delete all jobs. Mutually exclusive with job-id",
-)
-@click.option(
-    "-m",
-    "--metadata",
-    is_flag=True,
-    default=False,
-    help="Delete job metadata in addition to logs",
-)
-@click.option(
-    "-s",
-    "--since",
-    type=TimeOrDateTime(),
-    help="When using -a/--all, don't delete jobs before this datetime",
-)
-@click.option(
-    "-u",
-    "--until",
-    type=TimeOrDateTime(),
-    help="When using -a/--all, don't delete jobs after this datetime",
-)
-@click.option(
-    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
-)
-@global_options
-def cli_purge(
-    job_ids: Tuple[str, ...],
-    _all: bool,
-    metadata: bool,
-    since: Optional[datetime],
-    until: Optional[datetime],
-    force: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Delete metadata for historical job(s) JOB_IDS."""
-
-    if not force:
-        click.confirm(
-            "⚠️  Purging will permanently delete all specified job history and logs."
-            " Continue?",
-            abort=True,
-        )
-    cli_exec(
-        display_purge,
-        quiet,
-        json,
-        plain,
-        debug,
-        job_ids,
-        _all,
-        metadata,
-        since,
-        until,
-    )
-
-
-@cli.command("reset", context_settings=CONTEXT_SETTINGS)
-@click.option(
-    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
-)
-@global_options
-def cli_reset(
-    force: bool,
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Destroy and recreate Jobman metadata database. Delete all job logs."""
-    if not force:
-        click.confirm(
-            "⚠️  Resetting will permanently delete all job history and logs. Continue?",
-            abort=True,
-        )
-    cli_exec(display_reset, quiet, json, plain, debug)
-
+        click.option(
+            "-p",
+            "--plain",
+            is_flag=True,
+            default=False,
+            help=(
+                "Show output in plain machine-readable format. Mutually exclusive"
+                " with -j/--json"
+            ),
+        ),
+        click.option(
+            "-d",
+            "--debug",
+            is_flag=True,
+            default=False,
+            help="Show detailed debugging logs",
+        ),
+    ]
+    # apply bottom-up, as stacked decorators would be, to keep the help order
+    for option in reversed(options):
+        f = option(f)
 
-@cli.command("install-completions", context_settings=CONTEXT_SETTINGS)
-@click.argument(
-    "shell",
-    nargs=1,
-    required=False,
-    default=None,
-    shell_complete=lambda *_: ["bash", "zsh", "fish"],
-)
-@global_options
-def cli_install_completions(
-    shell: Optional[str],
-    quiet: bool,
-    json: bool,
-    plain: bool,
-    debug: bool,
-) -> None:
-    """Configure shell for command, argument, and option completions."""
-    cli_exec(display_install_completions, quiet, json, plain, debug, shell)
+    return f
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import click
+
+from ..cli import CONTEXT_SETTINGS, cli_exec, global_options
+
+# shells offered when completing the SHELL argument
+SHELLS = ("bash", "zsh", "fish")
+
+
+@click.command("install-completions", context_settings=CONTEXT_SETTINGS)
+@click.argument(
+    "shell",
+    nargs=1,
+    required=False,
+    default=None,
+    shell_complete=lambda *_: SHELLS,
+)
+@click.option(
+    "-n",
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Check whether completions are installed without installing them",
+)
+@global_options
+def cli_install_completions(
+    shell: Optional[str],
+    dry_run: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Configure shell for command, argument, and option completions."""
+    cli_exec("install-completions", quiet, json, plain, debug, shell, dry_run)
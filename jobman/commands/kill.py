@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import click
+
+from ..cli import (
+    CONTEXT_SETTINGS,
+    SignalChoice,
+    cli_exec,
+    complete_job_id,
+    global_options,
+)
+
+# built here rather than in cli.py so that signals are only enumerated when the
+# kill command is loaded
+SIGNAL_CHOICE = SignalChoice()
+
+
+@click.command("kill", context_settings=CONTEXT_SETTINGS)
+@click.argument("job-id", nargs=-1, required=True, shell_complete=complete_job_id)
+@click.option(
+    "-s",
+    "--signal",
+    type=SIGNAL_CHOICE,
+    default="SIGINT",
+    show_default=True,
+    help=(
+        "Name (e.g., SIGINT) or integer number (e.g., 2) of signal to send to job"
+        " process"
+    ),
+)
+@click.option(
+    "-r",
+    "--allow-retries",
+    is_flag=True,
+    default=False,
+    help="Don't stop future retries from running if retries remain for the job",
+)
+@click.option(
+    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
+)
+@global_options
+def cli_kill(
+    job_ids: Tuple[str, ...],
+    signal: str,
+    allow_retries: bool,
+    force: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Stop running job JOB_IDS."""
+    multiple = len(job_ids) > 1
+    if not force:
+        click.confirm(
+            "⚠️  Are you sure you want to stop"
+            f" job{'s' if multiple else ''} {', '.join(job_ids)}?",
+            abort=True,
+        )
+    cli_exec("kill", quiet, json, plain, debug, job_ids, signal, allow_retries)
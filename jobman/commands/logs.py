@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+import click
+
+from ..cli import (
+    CONTEXT_SETTINGS,
+    NON_NEGATIVE_INT,
+    TIME_OR_DATETIME,
+    cli_exec,
+    complete_job_id,
+    global_options,
+)
+
+
+@click.command("logs", context_settings=CONTEXT_SETTINGS)
+@click.argument("job-id", nargs=1, shell_complete=complete_job_id)
+@click.option(
+    "-o",
+    "--hide-stdout",
+    is_flag=True,
+    default=False,
+    help="Don't display job's stdout",
+)
+@click.option(
+    "-e",
+    "--hide-stderr",
+    is_flag=True,
+    default=False,
+    help="Don't display job's stderr",
+)
+@click.option(
+    "-f",
+    "--follow",
+    is_flag=True,
+    default=False,
+    help="Display running log messages as output",
+)
+@click.option(
+    "-x",
+    "--no-log-prefix",
+    is_flag=True,
+    default=False,
+    help="Don't display leading log timestamp info",
+)
+@click.option(
+    "-n",
+    "--tail",
+    type=NON_NEGATIVE_INT,
+    help="Show only the last n lines of log output",
+)
+@click.option(
+    "-s", "--since", type=TIME_OR_DATETIME, help="Don't show logs before this datetime"
+)
+@click.option(
+    "-u", "--until", type=TIME_OR_DATETIME, help="Don't show logs after this datetime"
+)
+@global_options
+def cli_logs(
+    job_id: str,
+    hide_stdout: bool,
+    hide_stderr: bool,
+    follow: bool,
+    no_log_prefix: bool,
+    tail: Optional[int],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Show output from job JOB_ID."""
+    cli_exec(
+        "logs",
+        quiet,
+        json,
+        plain,
+        debug,
+        job_id,
+        hide_stdout,
+        hide_stderr,
+        follow,
+        no_log_prefix,
+        tail,
+        since,
+        until,
+    )
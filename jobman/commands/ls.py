@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import click
+
+from ..cli import CONTEXT_SETTINGS, cli_exec, global_options
+
+
+@click.command("ls", context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-a", "--all", "all_", is_flag=True, default=False, help="Include finished jobs"
+)
+@click.option(
+    "-r",
+    "--show-runs",
+    is_flag=True,
+    default=False,
+    help="Show details of individual runs",
+)
+@global_options
+def cli_ls(
+    all_: bool,
+    show_runs: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """View jobs."""
+    cli_exec("ls", quiet, json, plain, debug, all_, show_runs)
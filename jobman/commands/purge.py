@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+import click
+
+from ..cli import (
+    CONTEXT_SETTINGS,
+    TIME_OR_DATETIME,
+    cli_exec,
+    complete_job_id,
+    global_options,
+)
+
+
+@click.command("purge", context_settings=CONTEXT_SETTINGS)
+@click.argument("job-ids", nargs=-1, required=False, shell_complete=complete_job_id)
+@click.option(
+    "-a",
+    "--all",
+    "_all",
+    is_flag=True,
+    default=False,
+    help="Delete all jobs. Mutually exclusive with job-id",
+)
+@click.option(
+    "-m",
+    "--metadata",
+    is_flag=True,
+    default=False,
+    help="Delete job metadata in addition to logs",
+)
+@click.option(
+    "-s",
+    "--since",
+    type=TIME_OR_DATETIME,
+    help="When using -a/--all, don't delete jobs before this datetime",
+)
+@click.option(
+    "-u",
+    "--until",
+    type=TIME_OR_DATETIME,
+    help="When using -a/--all, don't delete jobs after this datetime",
+)
+@click.option(
+    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
+)
+@global_options
+def cli_purge(
+    job_ids: Tuple[str, ...],
+    _all: bool,
+    metadata: bool,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    force: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Delete metadata for historical job(s) JOB_IDS."""
+
+    if not force:
+        click.confirm(
+            "⚠️  Purging will permanently delete all specified job history and logs."
+            " Continue?",
+            abort=True,
+        )
+    cli_exec(
+        "purge",
+        quiet,
+        json,
+        plain,
+        debug,
+        job_ids,
+        _all,
+        metadata,
+        since,
+        until,
+    )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import click
+
+from ..cli import CONTEXT_SETTINGS, cli_exec, global_options
+
+
+@click.command("reset", context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "-f", "--force", is_flag=True, default=False, help="Don't prompt for confirmation"
+)
+@global_options
+def cli_reset(
+    force: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Destroy and recreate Jobman metadata database. Delete all job logs."""
+    if not force:
+        click.confirm(
+            "⚠️  Resetting will permanently delete all job history and logs. Continue?",
+            abort=True,
+        )
+    cli_exec("reset", quiet, json, plain, debug)
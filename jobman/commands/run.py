@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Tuple, TypeVar
+
+import click
+
+from ..cli import (
+    CONTEXT_SETTINGS,
+    EXIT_CODE,
+    FILE_PATH,
+    NON_NEGATIVE_INT,
+    TIME_OR_DATETIME,
+    TIMEDELTA,
+    cli_exec,
+    global_options,
+)
+
+R = TypeVar("R")
+
+# (event, when the notification is sent) for each --notify-on-<event> option
+NOTIFY_EVENTS = [
+    ("job-completion", "the job completes"),
+    ("run-completion", "any run of the job completes"),
+    ("job-success", "the job completes successfully"),
+    ("run-success", "any run of the job completes successfully"),
+    ("job-failure", "the job fails"),
+    ("run-failure", "a run of the job fails"),
+]
+
+
+def notify_options(f: Callable[..., R]) -> Callable[..., R]:
+    """
+    Attach a --notify-on-<event> option to f for each of NOTIFY_EVENTS.
+    """
+    # apply bottom-up, as stacked decorators would be, to keep the help order
+    for event, when in reversed(NOTIFY_EVENTS):
+        f = click.option(
+            f"--notify-on-{event}",
+            type=str,
+            multiple=True,
+            help=f"Send a notification to this callback when {when}",
+        )(f)
+
+    return f
+
+
+@click.command("run", context_settings=CONTEXT_SETTINGS)
+@click.argument("command", nargs=-1, required=True)
+@click.option(
+    "--wait-time",
+    type=TIME_OR_DATETIME,
+    help="Do not run the command until the specified date or time",
+)
+@click.option(
+    "--wait-duration",
+    type=TIMEDELTA,
+    help="Do not run the command until the specified duration has elapsed",
+)
+@click.option(
+    "--wait-for-file",
+    "wait_for_files",
+    type=FILE_PATH,
+    multiple=True,
+    help="Do not run the command until the specified file exists",
+)
+@click.option(
+    "--abort-time",
+    type=TIME_OR_DATETIME,
+    help="Terminate the command if it's still running at the specified time",
+)
+@click.option(
+    "--abort-duration",
+    type=TIMEDELTA,
+    help=(
+        "Terminate the command if it's still running after the specified duration has"
+        " elapsed"
+    ),
+)
+@click.option(
+    "--abort-for-file",
+    "abort_for_files",
+    type=FILE_PATH,
+    multiple=True,
+    help="Terminate the command if it's still running and the specified file exists",
+)
+@click.option(
+    "--retry-attempts",
+    type=NON_NEGATIVE_INT,
+    help="If the command fails, rerun the command up to the specified number",
+)
+@click.option(
+    "--retry-delay",
+    type=TIMEDELTA,
+    help="Wait the specified time before starting retries",
+)
+@click.option(
+    "-e",
+    "--retry-expo-backoff",
+    is_flag=True,
+    default=False,
+    help="Exponentially increase delay between retries",
+)
+@click.option(
+    "-t",
+    "--retry-jitter",
+    is_flag=True,
+    default=False,
+    help=(
+        "Add extra delay between retries randomly selected uniform over the range -1 *"
+        " (retry-delay / 10) to (retry-delay / 10)"
+    ),
+)
+@click.option(
+    "-c",
+    "--success-code",
+    "success_codes",
+    type=EXIT_CODE,
+    multiple=True,
+    default=[0],
+    show_default=True,
+    help="Interpret these exit codes as a successful execution",
+)
+@notify_options
+@click.option(
+    "-f",
+    "--follow",
+    is_flag=True,
+    default=False,
+    help="Display a running log of the command's output",
+)
+@global_options
+def cli_run(
+    command: Tuple[str, ...],
+    wait_time: Optional[datetime],
+    wait_duration: Optional[timedelta],
+    wait_for_files: Optional[Tuple[Path]],
+    abort_time: Optional[datetime],
+    abort_duration: Optional[timedelta],
+    abort_for_files: Optional[Tuple[Path]],
+    retry_attempts: Optional[int],
+    retry_delay: Optional[timedelta],
+    retry_expo_backoff: bool,
+    retry_jitter: bool,
+    success_codes: Tuple[int],
+    notify_on_run_completion: Optional[Tuple[str]],
+    notify_on_job_completion: Optional[Tuple[str]],
+    notify_on_job_success: Optional[Tuple[str]],
+    notify_on_run_success: Optional[Tuple[str]],
+    notify_on_job_failure: Optional[Tuple[str]],
+    notify_on_run_failure: Optional[Tuple[str]],
+    follow: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Start a job in the background immune to hangups."""
+    cli_exec(
+        "run",
+        quiet,
+        json,
+        plain,
+        debug,
+        command,
+        wait_time,
+        wait_duration,
+        wait_for_files,
+        abort_time,
+        abort_duration,
+        abort_for_files,
+        retry_attempts,
+        retry_delay,
+        retry_expo_backoff,
+        retry_jitter,
+        success_codes,
+        notify_on_run_completion,
+        notify_on_job_completion,
+        notify_on_job_success,
+        notify_on_run_success,
+        notify_on_job_failure,
+        notify_on_run_failure,
+        follow,
+    )
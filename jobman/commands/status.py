@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import click
+
+from ..cli import CONTEXT_SETTINGS, cli_exec, complete_job_id, global_options
+
+
+@click.command("status", context_settings=CONTEXT_SETTINGS)
+@click.argument("job-ids", nargs=-1, required=True, shell_complete=complete_job_id)
+@click.option(
+    "-n",
+    "--no-runs",
+    is_flag=True,
+    default=False,
+    help="Don't show details of individual runs",
+)
+@click.option(
+    "-a",
+    "--all",
+    "all_",
+    is_flag=True,
+    default=False,
+    help="Display all job properties",
+)
+@global_options
+def cli_status(
+    job_ids: Tuple[str, ...],
+    no_runs: bool,
+    all_: bool,
+    quiet: bool,
+    json: bool,
+    plain: bool,
+    debug: bool,
+) -> None:
+    """Display the status of a job(s) JOB_IDS."""
+    cli_exec("status", quiet, json, plain, debug, job_ids, no_runs, all_)
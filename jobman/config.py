@@ -1,70 +1,194 @@
+from __future__ import annotations
+
 import os
+import re
+from dataclasses import dataclass, field, fields
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
-
-import ruamel.yaml
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing import Any, Dict, List, Optional
 
 from .exceptions import JobmanError
 
 CONFIG_HOME = Path(
     os.environ.get("JOBMAN_CONFIG_HOME", "~/.config/jobman/")
 ).expanduser()
+DEFAULT_STORAGE_PATH = Path("~/.local/share/jobman").expanduser()
 
+# duration strings accepted for gc_expiry, as pydantic's timedelta parsing
+# accepted them: ISO 8601 (P7D, PT1H30M; a year is 365 days and a month 30)
+# and clock-style ([-][D day[s][,] ]HH:MM[:SS[.ffffff]])
+_NUM = r"(\d+(?:\.\d+)?)"
+ISO_DURATION_RE = re.compile(
+    rf"([-+])?P(?:{_NUM}Y)?(?:{_NUM}M)?(?:{_NUM}W)?(?:{_NUM}D)?"
+    rf"(?:T(?:{_NUM}H)?(?:{_NUM}M)?(?:{_NUM}S)?)?"
+)
+ISO_DURATION_SECS = (365 * 86400, 30 * 86400, 7 * 86400, 86400, 3600, 60, 1)
+CLOCK_DURATION_RE = re.compile(
+    r"([-+])?(?:(\d+) ?[dD](?:ays?)?,? ?)?"
+    r"(?:(\d+):([0-5]\d)(?::([0-5]\d(?:\.\d{1,6})?))?)?"
+)
 
-class JobmanConfig(BaseModel):
-    storage_path: Path = Path("~/.local/share/jobman")
-    gc_expiry: timedelta = timedelta(days=7)
-    notification_sinks: List[Dict[str, str]] = Field(default_factory=lambda: [])
-    db_path: Path = Path()
-    stdio_path: Path = Path()
 
-    model_config = ConfigDict(extra="forbid", frozen=False)
+@dataclass
+class JobmanConfig:
+    storage_path: Path = DEFAULT_STORAGE_PATH
+    gc_expiry: timedelta = timedelta(days=7)
+    notification_sinks: List[Dict[str, str]] = field(default_factory=list)
+    db_path: Path = field(init=False)
+    stdio_path: Path = field(init=False)
 
-    def model_post_init(self, __config: Any) -> None:
-        self.storage_path = self.storage_path.expanduser()
+    def __post_init__(self) -> None:
+        self.storage_path = Path(self.storage_path)
+        if str(self.storage_path).startswith("~"):
+            self.storage_path = self.storage_path.expanduser()
         self.db_path = self.storage_path / "jobman.db"
         self.stdio_path = self.storage_path / "stdio"
 
+    @classmethod
+    def from_dict(cls, config_dict: Any) -> "JobmanConfig":
+        """
+        Build a config from the contents of a config file, raising a ValueError
+        on unknown keys or values of the wrong type.
+        """
+        if not isinstance(config_dict, dict):
+            raise ValueError("expected a mapping of config keys to values")
+
+        known_keys = {f.name for f in fields(cls) if f.init}
+        unknown_keys = set(config_dict) - known_keys
+        if unknown_keys:
+            raise ValueError(
+                f"unknown keys {', '.join(sorted(map(str, unknown_keys)))}"
+            )
+
+        kwargs: Dict[str, Any] = {}
+        if "storage_path" in config_dict:
+            kwargs["storage_path"] = _parse_path(config_dict["storage_path"])
+        if "gc_expiry" in config_dict:
+            kwargs["gc_expiry"] = _parse_timedelta(config_dict["gc_expiry"])
+        if "notification_sinks" in config_dict:
+            kwargs["notification_sinks"] = _parse_notification_sinks(
+                config_dict["notification_sinks"]
+            )
+
+        return cls(**kwargs)
+
+
+def _parse_path(value: Any) -> Path:
+    if not isinstance(value, (str, Path)):
+        raise ValueError(f"expected a path, got {value!r}")
+    return Path(value)
+
+
+def _parse_timedelta(value: Any) -> timedelta:
+    """
+    Interpret value as a timedelta, a number of seconds, or a duration string.
+    """
+    if isinstance(value, timedelta):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(seconds=value)
+    if isinstance(value, str):
+        td = _parse_duration_str(value)
+        if td is not None:
+            return td
+    raise ValueError(f"expected a duration, got {value!r}")
+
+
+def _parse_duration_str(value: str) -> Optional[timedelta]:
+    """
+    Parse an ISO 8601 or clock-style duration, or return None if value is
+    neither.
+    """
+    match = ISO_DURATION_RE.fullmatch(value)
+    if match and any(match.groups()[1:]):
+        sign, *amounts = match.groups()
+        secs = sum(
+            float(amount) * unit_secs
+            for amount, unit_secs in zip(amounts, ISO_DURATION_SECS)
+            if amount
+        )
+    else:
+        match = CLOCK_DURATION_RE.fullmatch(value)
+        if not match or not (match[2] or match[3]):
+            return None
+        sign, days, hours, minutes, seconds = match.groups()
+        # as in pydantic, hours need two digits unless seconds are given, and
+        # are less than 24 after a number of days
+        if hours and ((not seconds and len(hours) < 2) or (days and int(hours) > 23)):
+            return None
+        secs = (
+            int(days or 0) * 86400
+            + int(hours or 0) * 3600
+            + int(minutes or 0) * 60
+            + float(seconds or 0)
+        )
+
+    try:
+        td = timedelta(seconds=secs)
+    except OverflowError:
+        raise ValueError(f"duration {value!r} is too large")
+    return -td if sign == "-" else td
+
+
+def _parse_notification_sinks(value: Any) -> List[Dict[str, str]]:
+    if not isinstance(value, list) or not all(
+        isinstance(sink, dict)
+        and all(isinstance(k, str) and isinstance(v, str) for k, v in sink.items())
+        for sink in value
+    ):
+        raise ValueError(f"expected a list of string mappings, got {value!r}")
+    return value
+
 
 def _load_config_file(config_file_path: Path) -> Dict[str, Any]:
     """
     Read the configuration file into a dictionary.
     """
-    if not config_file_path.is_file():
+    # a missing file is the common case, so let the read report it rather than
+    # stat-ing the path first
+    try:
+        data = config_file_path.read_bytes()
+    except FileNotFoundError:
         empty_config: Dict[str, Any] = dict()
         return empty_config
 
+    # imported here so that invocations without a config file never pay for
+    # loading the YAML library. Its safe loader uses the libyaml-based C parser
+    # from ruamel.yaml.clib where available
+    import ruamel.yaml
+
     yaml = ruamel.yaml.YAML(typ="safe")
-    with open(config_file_path, "r") as f:
-        config: Dict[str, Any] = yaml.load(f)
+    try:
+        config: Dict[str, Any] = yaml.load(data) or dict()
+    except (ruamel.yaml.parser.ParserError, ruamel.yaml.scanner.ScannerError):
+        raise JobmanError(
+            f"Failed to parse config file {config_file_path}", exit_code=os.EX_CONFIG
+        )
 
     return config
 
 
+@lru_cache(maxsize=1)
 def load_config() -> JobmanConfig:
     """
-    Read the configuration file and parse it into a Configuration object.
+    Read the configuration file and parse it into a Configuration object. The
+    result is cached for the life of the process; call load_config.cache_clear()
+    to reread the file.
     """
     config_path = CONFIG_HOME / "config.yml"
     try:
         config_dict = _load_config_file(config_path)
-    except (
-        IOError,
-        OSError,
-        ruamel.yaml.parser.ParserError,
-        ruamel.yaml.scanner.ScannerError,
-    ):
+    except (IOError, OSError):
         raise JobmanError(
             f"Failed to parse config file {config_path}", exit_code=os.EX_CONFIG
         )
 
     try:
-        jobman_config = JobmanConfig.model_validate(config_dict)
-    except ValidationError:
+        jobman_config = JobmanConfig.from_dict(config_dict)
+    except ValueError as e:
         raise JobmanError(
-            f"Invalid config file at {config_path}", exit_code=os.EX_CONFIG
+            f"Invalid config file at {config_path}: {e}", exit_code=os.EX_CONFIG
         )
 
     return jobman_config
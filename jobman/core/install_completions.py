@@ -3,8 +3,10 @@ Convenience method for installing jobman shell completion scripts.
 """
 
 import logging
+import mmap
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, NamedTuple, Optional
 
@@ -18,48 +20,89 @@ class Shell(NamedTuple):
     name: str
     config_path: Path
     completion_script: str
+    # whether config_path's directory may not exist yet. rc files in the home
+    # directory don't need one created
+    needs_parent_mkdir: bool
 
 
 COMPLETION_FLAG = "managed by jobman install-completions"
-COMPLETION_SUPPORTED_SHELLS: Dict[str, Shell] = {
-    "bash": Shell(
-        name="bash",
-        config_path=Path("~/.bashrc").expanduser(),
-        completion_script=(
-            f'eval "$(_JOBMAN_COMPLETE=bash_source jobman)"  # {COMPLETION_FLAG}'
+
+# rc files smaller than this are read directly rather than memory-mapped
+MMAP_MIN_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def completion_supported_shells() -> Dict[str, Shell]:
+    """
+    Returns the supported shells by name. Built on first use, since expanding
+    the rc file paths requires looking up the user's home directory.
+    """
+    return {
+        "bash": Shell(
+            name="bash",
+            config_path=Path("~/.bashrc").expanduser(),
+            completion_script=(
+                f'eval "$(_JOBMAN_COMPLETE=bash_source jobman)"  # {COMPLETION_FLAG}'
+            ),
+            needs_parent_mkdir=False,
         ),
-    ),
-    "zsh": Shell(
-        name="zsh",
-        config_path=Path("~/.zshrc").expanduser(),
-        completion_script=(
-            f'eval "$(_JOBMAN_COMPLETE=zsh_source jobman)"  # {COMPLETION_FLAG}'
+        "zsh": Shell(
+            name="zsh",
+            config_path=Path("~/.zshrc").expanduser(),
+            completion_script=(
+                f'eval "$(_JOBMAN_COMPLETE=zsh_source jobman)"  # {COMPLETION_FLAG}'
+            ),
+            needs_parent_mkdir=False,
         ),
-    ),
-    "fish": Shell(
-        name="fish",
-        config_path=Path("~/.config/fish/completions/foo-bar.fish").expanduser(),
-        completion_script=(
-            f"_JOBMAN_COMPLETE=fish_source jobman | source  # {COMPLETION_FLAG}"
+        "fish": Shell(
+            name="fish",
+            config_path=Path("~/.config/fish/completions/foo-bar.fish").expanduser(),
+            completion_script=(
+                f"_JOBMAN_COMPLETE=fish_source jobman | source  # {COMPLETION_FLAG}"
+            ),
+            needs_parent_mkdir=True,
         ),
-    ),
-}
+    }
+
+
+@lru_cache(maxsize=32)
+def _search_file(path: str, mtime_ns: int, flag: str) -> bool:
+    """
+    Returns true iff the specified flag exists in the file at path. mtime_ns
+    only serves as part of the cache key, so that a modified file is rescanned.
+    The file is searched as bytes, skipping the decode, and memory-mapped
+    unless it's small enough that the mapping costs more than a read.
+    """
+    flag_bytes = flag.encode()
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size < MMAP_MIN_SIZE:
+            return flag_bytes in fp.read()
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(flag_bytes) != -1
 
 
 def _search(flag: str, f: Path) -> bool:
     """
-    Returns true iff the specified flag exists in the file f.
+    Returns true iff the specified flag exists in the file f. The result is
+    cached until the file's modification time changes.
     """
-    with open(f, "r") as fp:
-        return flag in fp.read()
+    try:
+        stat = os.stat(f)
+    except FileNotFoundError:
+        return False
+
+    if stat.st_size < len(flag):
+        # too short to contain the flag, e.g. a freshly created rc file
+        return False
+
+    return _search_file(str(f), stat.st_mtime_ns, flag)
 
 
 def _append(text: str, f: Path) -> None:
     """
     Appends the text to the file f.
     """
-    f.parent.mkdir(parents=True, exist_ok=True)
-    with open(f, "a+") as fp:
+    with open(f, "a") as fp:
         fp.write(text + "\n")
 
 
@@ -74,14 +117,14 @@ def _get_shell_name() -> str:
             exit_code=os.EX_NOTFOUND,
         )
 
-    shell_path = Path(shell_var)
-    shell = shell_path.name
+    shell = os.path.basename(shell_var)
 
     return shell
 
 
 def display_install_completions(
     shell_name: Optional[str],
+    dry_run: bool,
     config: JobmanConfig,
     displayer: Displayer,
     logger: logging.Logger,
@@ -89,7 +132,9 @@ def display_install_completions(
     """
     Ensure shell completions installed for the specified shell.
     """
-    install_completions_result = install_completions(shell_name, config, logger)
+    install_completions_result = install_completions(
+        shell_name, config, logger, dry_run=dry_run
+    )
     if install_completions_result.already_installed:
         displayer.print(
             pretty_content=(
@@ -109,6 +154,24 @@ def display_install_completions(
             level=DisplayLevel.NORMAL,
             style=DisplayStyle.SUCCESS,
         )
+    elif dry_run:
+        displayer.print(
+            pretty_content=(
+                "Dry run: would install completions for"
+                f" {install_completions_result.shell.name} shell"
+            ),
+            plain_content=(
+                "Dry run: would install completions for"
+                f" {install_completions_result.shell.name} shell"
+            ),
+            json_content={
+                "result": "dry_run",
+                "message": "would install",
+                "shell": install_completions_result.shell.name,
+            },
+            stream=sys.stderr,
+            level=DisplayLevel.NORMAL,
+        )
     else:
         displayer.print(
             pretty_content=(
@@ -141,6 +204,8 @@ def install_completions(
     shell_name: Optional[str] = None,
     config: Optional[JobmanConfig] = None,
     logger: Optional[logging.Logger] = None,
+    *,
+    dry_run: bool = False,
 ) -> InstallCompletionsResult:
     if not config:
         config = load_config()
@@ -150,7 +215,7 @@ def install_completions(
     logger.info(f"Supplied {shell_name=}")
     shell_name = shell_name or _get_shell_name()
     logger.info(f"Attempting to install completions for {shell_name=}")
-    shell = COMPLETION_SUPPORTED_SHELLS.get(shell_name)
+    shell = completion_supported_shells().get(shell_name)
     if not shell:
         raise JobmanError(
             f"Completions are not supported for {shell_name} shell.",
@@ -158,7 +223,9 @@ def install_completions(
         )
 
     already_installed = _search(COMPLETION_FLAG, shell.config_path)
-    if not already_installed:
+    if not already_installed and not dry_run:
+        if shell.needs_parent_mkdir:
+            shell.config_path.parent.mkdir(parents=True, exist_ok=True)
         _append(shell.completion_script, shell.config_path)
 
     return InstallCompletionsResult(shell=shell, already_installed=already_installed)
@@ -2,7 +2,9 @@ import logging
 import os
 import sys
 from signal import Signals
-from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from peewee import JOIN
 
 from ..base_logger import make_logger
 from ..config import JobmanConfig, load_config
@@ -11,6 +13,25 @@ from ..host import get_host_id
 from ..models import Job, Run, RunState, init_db_models
 
 
+def _print_section(
+    header: str,
+    pretty_lines: List[str],
+    plain_lines: List[str],
+    displayer: Displayer,
+) -> None:
+    """
+    Display a header and its per-job lines as one message, so that each
+    section is rendered and written in a single call.
+    """
+    displayer.print(
+        pretty_content="\n".join([header, *pretty_lines]),
+        plain_content="\n".join(plain_lines),
+        json_content=None,
+        stream=sys.stderr,
+        level=DisplayLevel.NORMAL,
+    )
+
+
 def display_kill(
     job_ids: Tuple[str, ...],
     signal: str,
@@ -29,25 +50,16 @@ def display_kill(
     json_contents: Dict[str, Union[str, List[str], List[Tuple[str, int]]]] = {}
     if nonexistent_job_ids:
         multiple = len(nonexistent_job_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 "⚠️  [bold yellow]Warning: [/ bold yellow]No"
                 f" such{' ' + str(len(nonexistent_job_ids)) if multiple else ''}"
                 f" job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  {jid}" for jid in nonexistent_job_ids],
+            [f"No such job {jid}" for jid in nonexistent_job_ids],
+            displayer,
         )
-        for jid in nonexistent_job_ids:
-            displayer.print(
-                pretty_content=f"  {jid}",
-                plain_content=f"No such job {jid}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "result": "error",
@@ -58,25 +70,16 @@ def display_kill(
 
     if nonrunning_job_ids:
         multiple = len(nonrunning_job_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 "⚠️  [bold yellow]Warning:[/ bold yellow] No active runs"
                 f" for{' ' + str(len(nonrunning_job_ids)) if multiple else ''}"
                 f" job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  {jid}" for jid in nonrunning_job_ids],
+            [f"No active run for job {jid}" for jid in nonrunning_job_ids],
+            displayer,
         )
-        for jid in nonrunning_job_ids:
-            displayer.print(
-                pretty_content=f"  {jid}",
-                plain_content=f"No active run for job {jid}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "result": "error",
@@ -89,24 +92,18 @@ def display_kill(
 
     if failed_killed_run_ids:
         multiple = len(failed_killed_run_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 "⚠️  [bold yellow]Warning:[/ bold yellow] Failed to"
                 f" kill{' ' + str(len(failed_killed_run_ids)) if multiple else ''} job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  {jid}, attempt {attempt}" for jid, attempt in failed_killed_run_ids],
+            [
+                f"Failed to kill {jid}, attempt {attempt}"
+                for jid, attempt in failed_killed_run_ids
+            ],
+            displayer,
         )
-        for jid, attempt in failed_killed_run_ids:
-            displayer.print(
-                pretty_content=f"  {jid}, attempt {attempt}",
-                plain_content=f"Failed to kill {jid}, attempt {attempt}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "result": "error",
@@ -117,23 +114,14 @@ def display_kill(
 
     if killed_run_ids:
         multiple = len(killed_run_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 f"Killed{' ' + str(len(killed_run_ids)) if multiple else ''} job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  ❌ {jid}, attempt {attempt}" for jid, attempt in killed_run_ids],
+            [f"{jid}, attempt {attempt}" for jid, attempt in killed_run_ids],
+            displayer,
         )
-        for jid, attempt in killed_run_ids:
-            displayer.print(
-                pretty_content=f"  ❌ {jid}, attempt {attempt}",
-                plain_content=f"{jid}, attempt {attempt}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "killed_run_ids": killed_run_ids,
@@ -154,13 +142,17 @@ def display_kill(
     return os.EX_DATAERR if failed else os.EX_OK
 
 
+# signal name -> number, so names resolve without the Enum lookup machinery
+SIGNAL_NUMS: Dict[str, int] = {s.name: s.value for s in Signals}
+
+
 def get_signal_num(signal: str) -> int:
     try:
         # first check if the signal is a number
         signal_num = int(signal)
     except ValueError:
         # if it's not a number, it must be a name
-        signal_num = Signals[signal].value
+        signal_num = SIGNAL_NUMS[signal]
 
     return signal_num
 
@@ -186,6 +178,15 @@ def kill(
     config: Optional[JobmanConfig] = None,
     logger: Optional[logging.Logger] = None,
 ) -> killResult:
+    if not job_ids:
+        # nothing to kill, so don't open the database
+        return killResult(
+            nonexistent_job_ids=[],
+            nonrunning_job_ids=[],
+            killed_run_ids=[],
+            failed_killed_run_ids=[],
+        )
+
     if not config:
         config = load_config()
     if not logger:
@@ -194,31 +195,74 @@ def kill(
     init_db_models(config.db_path)
     logger.info(f"Successfully connected to database in {config.storage_path}")
 
-    # find active runs
-    jobs_q = Job.select().where(  # type: ignore[no-untyped-call]
-        (Job.host_id == get_host_id()) & (Job.job_id << job_ids)  # type: ignore[operator]
+    # find the jobs and their active runs in one query, fetching only the
+    # columns used below. The outer join keeps jobs without an active run,
+    # which then have no active_run attribute
+    is_active_run = (
+        (Run.job == Job.job_id)
+        & (Run.state == RunState.RUNNING.value)
+        & (~Run.pid.is_null())  # type: ignore[union-attr]
     )
-    existent_job_ids = [j.job_id for j in jobs_q]
-    nonexistent_job_ids = [jid for jid in job_ids if jid not in existent_job_ids]
-
-    runs = list(
-        Run.select()  # type: ignore[no-untyped-call]
-        .join(Job)
+    jobs_q = (
+        Job.select(
+            Job.job_id, Run.id, Run.job, Run.attempt, Run.pid  # type: ignore[attr-defined]
+        )
+        .join(Run, JOIN.LEFT_OUTER, on=is_active_run, attr="active_run")
         .where(
-            (Job.job_id << existent_job_ids)  # type: ignore[operator]
-            & (Run.state == RunState.RUNNING.value)
-            & (~Run.pid.is_null())  # type: ignore[union-attr]
+            (Job.host_id == get_host_id())
+            & (Job.job_id << job_ids)  # type: ignore[operator]
         )
     )
-    running_job_ids = list(set(run.job.job_id for run in runs))
+    # a job appears once per active run, so collect its ID in a set
+    seen_job_ids: Set[str] = set()
+    runs: List[Run] = []
+    for job in jobs_q:
+        seen_job_ids.add(job.job_id)
+        run = getattr(job, "active_run", None)
+        if run is not None:
+            # attach the job already fetched, rather than refetching it
+            # lazily on each run.job access
+            run.job = job
+            runs.append(run)
+
+    # report jobs in the order the caller gave them, not the query's order
+    existent_job_ids = [jid for jid in dict.fromkeys(job_ids) if jid in seen_job_ids]
+    nonexistent_job_ids = [jid for jid in job_ids if jid not in seen_job_ids]
+
+    # drop runs whose process has already exited, so they're neither marked
+    # killed nor signalled, and their jobs are reported as having no active
+    # run. Their state is left for the supervisor to record. Signal 0 checks
+    # that the process exists without signalling it; the query above
+    # guarantees pid is set
+    live_runs = []
+    for run in runs:
+        try:
+            os.kill(run.pid, 0)  # type: ignore[arg-type]
+        except ProcessLookupError:
+            logger.info(
+                "Run %s attempt %s with PID %s is no longer running",
+                run.job.job_id,
+                run.attempt,
+                run.pid,
+            )
+            continue
+        except PermissionError:
+            # the process exists, but belongs to another user
+            pass
+        live_runs.append(run)
+    runs = live_runs
+
+    running_job_ids = {run.job.job_id for run in runs}
     nonrunning_job_ids = [jid for jid in existent_job_ids if jid not in running_job_ids]
 
-    if not allow_retries:
-        # mark runs killed so they can't be restarted
+    if not allow_retries and runs:
+        # mark runs killed so they can't be restarted, in a single UPDATE
+        Run.update(killed=True).where(
+            Run.id << [run.id for run in runs]  # type: ignore[attr-defined]
+        ).execute()
         for run in runs:
-            run.killed = True
-            run.save()
-            logger.info(f"Marked run {run.job.job_id} attempt {run.attempt} killed")
+            # lazy %-style args, as INFO records are usually discarded
+            logger.info("Marked run %s attempt %s killed", run.job.job_id, run.attempt)
 
     # kill runs with specified signal
     signal_num = get_signal_num(signal)
@@ -236,8 +280,11 @@ def kill(
 
         killed_run_ids.append((run.job.job_id, run.attempt))
         logger.info(
-            f"Killed run {run.job.job_id} attempt {run.attempt} with PID"
-            f" {run.pid} with signal {signal_num}"
+            "Killed run %s attempt %s with PID %s with signal %s",
+            run.job.job_id,
+            run.attempt,
+            run.pid,
+            signal_num,
         )
 
     return killResult(
@@ -1,10 +1,9 @@
 import logging
 import os
 import sys
-from typing import Dict, List, NamedTuple, Optional, Union
-
-from rich import box
-from rich.table import Table
+from collections import defaultdict
+from operator import itemgetter
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, NamedTuple, Optional, Union
 
 from ..base_logger import make_logger
 from ..config import JobmanConfig, load_config
@@ -12,6 +11,19 @@ from ..display import Displayer, DisplayLevel
 from ..host import get_host_id
 from ..models import Job, JobState, Run, init_db_models
 
+if TYPE_CHECKING:
+    from rich.syntax import Syntax
+
+# columns of the jobs table; state and exit code are only shown with -a/--all
+JOB_COL_NAMES = ("job_id", "command", "start_time", "finish_time")
+ALL_JOB_COL_NAMES = (*JOB_COL_NAMES, "state", "exit_code")
+RUN_COL_NAMES = ("attempt", "start_time", "finish_time", "state", "exit_code")
+
+# fetch a row's columns from a model's pretty dict in one call
+get_running_job_cols = itemgetter(*JOB_COL_NAMES)
+get_all_job_cols = itemgetter(*ALL_JOB_COL_NAMES)
+get_run_cols = itemgetter(*RUN_COL_NAMES)
+
 
 def display_ls(
     all_: bool,
@@ -38,8 +50,9 @@ def display_ls(
         )
         return os.EX_OK
 
-    # sort output with most recent jobs first
-    jobs.sort(key=lambda j: (j.start_time is None, j.start_time), reverse=True)
+    # imported here so that ls() callers that don't display never load rich
+    from rich import box
+    from rich.table import Table
 
     # print found jobs
     table = Table()
@@ -47,86 +60,51 @@ def display_ls(
     table.border_style = "blue"
     table.box = box.SIMPLE_HEAD
 
-    col_names = [
-        "job_id",
-        "command",
-        "start_time",
-        "finish_time",
-    ]
-    if all_:
-        col_names += [
-            "state",
-            "exit_code",
-        ]
+    col_names = ALL_JOB_COL_NAMES if all_ else JOB_COL_NAMES
+    get_job_cols = get_all_job_cols if all_ else get_running_job_cols
     table.add_column("ID", justify="right")
     for name in col_names[1:]:
         table.add_column(Job._name_to_display_name(name))
 
+    # bucket runs by job once, rather than filtering all runs for every job.
+    # job_id is the raw foreign key value, so the related Job isn't fetched
+    runs_by_job_id: DefaultDict[str, List[Run]] = defaultdict(list)
+    for run in runs or []:
+        runs_by_job_id[run.job_id].append(run)  # type: ignore[attr-defined]
+
     for job in jobs:
-        field_to_val = dict()
-        for name in col_names:
-            field_to_val[name] = job.pretty[name][1]
+        job_completed = job.is_completed()
+        # pretty formats every field on each access, so read it once per row
+        row: List[Union[str, "Syntax"]] = [val for _, val in get_job_cols(job.pretty)]
 
-        field_to_val["job_id"] = "[bold blue]" + str(field_to_val["job_id"])
         # make completed rows dim and colorize exit codes
-        field_to_val["job_id"] = (
-            "[dim]" + str(field_to_val["job_id"])
-            if job.is_completed()
-            else field_to_val["job_id"]
-        )
-        if "exit_code" in field_to_val:
+        row[0] = ("[dim][bold blue]" if job_completed else "[bold blue]") + str(row[0])
+        if all_:
             exit_code_color = (
-                ""
-                if not job.is_completed()
-                else ("[red]" if job.is_failed() else "[green]")
+                ("[red]" if job.is_failed() else "[green]") if job_completed else ""
             )
-            field_to_val["exit_code"] = exit_code_color + str(field_to_val["exit_code"])
+            row[-1] = exit_code_color + str(row[-1])
 
-        table.add_row(*field_to_val.values())
+        table.add_row(*row)
 
         if show_runs and runs:
-            job_runs = [r for r in runs if r.job.job_id == job.job_id]
-            job_runs.sort(
-                key=lambda r: (r.attempt, r.start_time is None, r.start_time),
-                reverse=True,
-            )
-            for run in job_runs:
-                run_col_names = [
-                    "attempt",
-                    "start_time",
-                    "finish_time",
-                    "state",
-                    "exit_code",
-                ]
-                field_to_val = dict()
-                for name in run_col_names:
-                    field_to_val[name] = run.pretty[name][1]
-
-                # field_to_val["attempt"] = "attempt " + field_to_val["attempt"]
+            success_codes = frozenset(job.success_codes)
+            for run in runs_by_job_id[job.job_id]:
+                run_completed = run.is_completed()
+                attempt, *run_row = [val for _, val in get_run_cols(run.pretty)]
+
                 # make completed rows dim and colorize exit codes
-                field_to_val["attempt"] = (
-                    "[dim]" + str(field_to_val["attempt"])
-                    if run.is_completed()
-                    else field_to_val["attempt"]
-                )
-                if "exit_code" in field_to_val:
+                if run_completed:
+                    attempt = "[dim]" + str(attempt)
                     exit_code_color = (
-                        ""
-                        if not run.is_completed()
-                        else (
-                            "[green]" if run.exit_code in job.success_codes else "[red]"
-                        )
-                    )
-                    field_to_val["exit_code"] = exit_code_color + str(
-                        field_to_val["exit_code"]
+                        "[green]" if run.exit_code in success_codes else "[red]"
                     )
+                    run_row[-1] = exit_code_color + str(run_row[-1])
 
-                vals = list(field_to_val.values())
-                vals.insert(1, "")
-                table.add_row(*vals)
+                # leave the command column empty for runs
+                table.add_row(attempt, "", *run_row)
 
     json_content: Dict[str, Union[List[Job], List[Run]]] = {"jobs": jobs}
-    plain_content = "\n".join(str(j.job_id) for j in jobs)
     if show_runs:
         if not runs:
             r: List[Run] = []
@@ -134,10 +112,10 @@ def display_ls(
         else:
             json_content["runs"] = runs
         plain_content = "\n".join(
-            f"{j.job_id}:"
-            f" {len([r for r in (runs or []) if r.job.job_id == j.job_id])} runs"
-            for j in jobs
+            f"{j.job_id}: {len(runs_by_job_id[j.job_id])} runs" for j in jobs
         )
+    else:
+        plain_content = "\n".join(str(j.job_id) for j in jobs)
 
     displayer.print(
         pretty_content=table,
@@ -177,12 +155,22 @@ def ls(
             & (Job.state << [JobState.SUBMITTED.value, JobState.RUNNING.value])  # type: ignore[operator]
         )
     )
-    jobs = list(jobs_q)
+    # most recent jobs first, with jobs that haven't started yet at the top.
+    # iterator() skips peewee's row cache, since the rows are copied into jobs
+    jobs_q = jobs_q.order_by(Job.start_time.desc(nulls="FIRST"))  # type: ignore[union-attr]
+    jobs = list(jobs_q.iterator())
     logger.info(f"Found {len(jobs)} job(s)")
 
     if show_runs:
-        runs_q = Run.select().join(Job).where(Job.job_id << [j.job_id for j in jobs])  # type: ignore[no-untyped-call, operator]
-        runs = list(runs_q)
+        # select the joined Job columns too, so each run's job is populated
+        # from this query rather than fetched lazily per run on display
+        runs_q = Run.select(Run, Job).join(Job).where(Job.job_id << [j.job_id for j in jobs])  # type: ignore[no-untyped-call, operator]
+        # latest attempts first, with unstarted runs first within an attempt
+        runs_q = runs_q.order_by(
+            Run.attempt.desc(),  # type: ignore[attr-defined]
+            Run.start_time.desc(nulls="FIRST"),  # type: ignore[union-attr]
+        )
+        runs = list(runs_q.iterator())
         logger.info(f"Found {len(runs)} run(s)")
     else:
         runs = None
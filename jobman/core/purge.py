@@ -2,33 +2,81 @@ import logging
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, TextIO, Tuple, Union
 
 import click
+from peewee import chunked
 
 from ..base_logger import make_logger
 from ..config import JobmanConfig, load_config
 from ..display import Displayer, DisplayLevel, DisplayStyle
 from ..host import get_host_id
-from ..models import Job, JobState, Run, init_db_models
-
-
-def _delete_job(job: Job, metadata: bool, logger: logging.Logger) -> None:
-    # first delete stdout/stderr logs
-    runs = Run.select().join(Job).where(Job.job_id == job.job_id)  # type: ignore[no-untyped-call]
-    # assumes that logs for all runs are stored under
-    # the same parent folder
-    if runs:
-        job_log_path = runs[0].log_path.parent
-        try:
-            shutil.rmtree(job_log_path)
-        except FileNotFoundError:
-            logger.warn(f"Stdout/stderr log folder {job_log_path} doesn't exist")
-
-    # then delete job record and dependent runs from db
+from ..models import Job, JobState, Run, db, init_db_models
+
+# upper bound on the number of job log folders deleted concurrently
+MAX_DELETE_WORKERS = 8
+
+# job IDs per bulk query, to stay under SQLite's limit on bound parameters
+DELETE_BATCH_SIZE = 500
+
+
+def _delete_log_folder(job_log_path: Path, logger: logging.Logger) -> None:
+    try:
+        shutil.rmtree(job_log_path)
+    except FileNotFoundError:
+        logger.warning(f"Stdout/stderr log folder {job_log_path} doesn't exist")
+
+
+def _delete_jobs(job_ids: List[str], metadata: bool, logger: logging.Logger) -> None:
+    # first delete stdout/stderr logs. Assumes that logs for all runs of a job
+    # are stored under the same parent folder, so one run per job suffices
+    job_log_paths: Dict[str, Path] = {}
+    for batch in chunked(job_ids, DELETE_BATCH_SIZE):
+        runs_q = Run.select(Run.job, Run.log_path).where(Run.job << batch)  # type: ignore[operator]
+        for run in runs_q.iterator():
+            job_log_paths[run.job_id] = run.log_path.parent
+
+    # rmtree spends most of its time in syscalls, which release the GIL
+    if job_log_paths:
+        max_workers = min(MAX_DELETE_WORKERS, len(job_log_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_delete_log_folder, job_log_path, logger)
+                for job_log_path in job_log_paths.values()
+            ]
+        # re-raise any error other than a missing folder, as a serial loop would
+        for future in futures:
+            future.result()
+
+    # then delete job records and dependent runs from db
     if metadata:
-        job.delete_instance(recursive=True)
+        with db.atomic():
+            for batch in chunked(job_ids, DELETE_BATCH_SIZE):
+                Run.delete().where(Run.job << batch).execute()  # type: ignore[operator, misc]
+                Job.delete().where(Job.job_id << batch).execute()  # type: ignore[operator, misc]
+
+
+def _print_section(
+    header: str,
+    pretty_lines: List[str],
+    plain_lines: List[str],
+    stream: TextIO,
+    displayer: Displayer,
+) -> None:
+    """
+    Display a header and its per-job lines as one message, so that each
+    section is rendered and written in a single call.
+    """
+    displayer.print(
+        pretty_content="\n".join([header, *pretty_lines]),
+        plain_content="\n".join(plain_lines),
+        json_content=None,
+        stream=stream,
+        level=DisplayLevel.NORMAL,
+    )
 
 
 def display_purge(
@@ -67,25 +115,17 @@ def display_purge(
 
     if nonexistent_job_ids:
         multiple = len(nonexistent_job_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 "⚠️  [bold yellow]Warning: [/ bold yellow]No"
                 f" such{' ' + str(len(nonexistent_job_ids)) if multiple else ''}"
                 f" job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  {jid}" for jid in nonexistent_job_ids],
+            [f"No such job {jid}" for jid in nonexistent_job_ids],
+            sys.stderr,
+            displayer,
         )
-        for jid in nonexistent_job_ids:
-            displayer.print(
-                pretty_content=f"  {jid}",
-                plain_content=f"No such job {jid}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "result": "error",
@@ -96,25 +136,17 @@ def display_purge(
 
     if skipped_job_ids:
         multiple = len(skipped_job_ids) > 1
-        displayer.print(
-            pretty_content=(
+        _print_section(
+            (
                 "⚠️  [bold yellow]Warning:[/ bold yellow]"
                 f" Skipped{' ' + str(len(skipped_job_ids)) if multiple else ''} running"
                 f" job{'s' if multiple else ''}:"
             ),
-            plain_content=None,
-            json_content=None,
-            stream=sys.stderr,
-            level=DisplayLevel.NORMAL,
+            [f"  🏃 {jid}" for jid in skipped_job_ids],
+            [f"Skipped purging running job {jid}" for jid in skipped_job_ids],
+            sys.stderr,
+            displayer,
         )
-        for jid in skipped_job_ids:
-            displayer.print(
-                pretty_content=f"  🏃 {jid}",
-                plain_content=f"Skipped purging running job {jid}",
-                json_content=None,
-                stream=sys.stderr,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update(
             {
                 "skipped_message": (
@@ -146,21 +178,13 @@ def display_purge(
                 f"{' ' + str(len(purged_job_ids)) if multiple else ''} job{'s' if multiple else ''}:"
             )
         )
-        displayer.print(
-            pretty_content=header,
-            plain_content=None,
-            json_content=None,
-            stream=sys.stdout,
-            level=DisplayLevel.NORMAL,
+        _print_section(
+            header,
+            [f"  🧹 {jid}" for jid in purged_job_ids],
+            purged_job_ids,
+            sys.stdout,
+            displayer,
         )
-        for jid in purged_job_ids:
-            displayer.print(
-                pretty_content=f"  🧹 {jid}",
-                plain_content=jid,
-                json_content=None,
-                stream=sys.stdout,
-                level=DisplayLevel.NORMAL,
-            )
         json_contents.update({"purged_job_ids": purged_job_ids})
         if "result" not in json_contents:
             json_contents["result"] = "success"
@@ -206,7 +230,8 @@ def purge(
     init_db_models(config.db_path)
     logger.info(f"Successfully connected to database in {config.storage_path}")
 
-    jobs_q = Job.select().where(Job.host_id == get_host_id())  # type: ignore[no-untyped-call]
+    # only the ID and state are read from matching jobs
+    jobs_q = Job.select(Job.job_id, Job.state).where(Job.host_id == get_host_id())
     if job_ids:
         jobs_q = jobs_q.where(Job.job_id << job_ids)  # type: ignore[operator]
     if since:
@@ -214,23 +239,24 @@ def purge(
     if until:
         jobs_q = jobs_q.where((Job.start_time or datetime.min) <= until)
 
-    running_jobs = jobs_q.where(Job.state != JobState.COMPLETE.value)
-    running_job_ids = [j.job_id for j in running_jobs]
-
-    jobs = list(jobs_q)
+    # partition the matching jobs here rather than querying again for the
+    # incomplete ones. Rows are read as plain tuples, since only the ID and
+    # state are needed
+    running_job_ids = []
     purged_job_ids = []
-    for job in jobs:
-        if job.job_id in running_job_ids:
-            logger.warn(f"Job {job.job_id} is not complete. Skipping.")
+    for job_id, state in jobs_q.tuples().iterator():
+        if state != JobState.COMPLETE.value:
+            logger.warn(f"Job {job_id} is not complete. Skipping.")
+            running_job_ids.append(job_id)
             continue
 
-        logger.warn(f"Deleting job {job.job_id}")
-        _delete_job(job, metadata, logger)
-        purged_job_ids.append(job.job_id)
+        logger.warn(f"Deleting job {job_id}")
+        purged_job_ids.append(job_id)
+
+    _delete_jobs(purged_job_ids, metadata, logger)
 
-    nonexistent_job_ids = [
-        jid for jid in job_ids if jid not in purged_job_ids + running_job_ids
-    ]
+    found_job_ids = set(running_job_ids).union(purged_job_ids)
+    nonexistent_job_ids = [jid for jid in job_ids if jid not in found_job_ids]
     return PurgeResult(
         nonexistent_job_ids=nonexistent_job_ids,
         purged_job_ids=purged_job_ids,
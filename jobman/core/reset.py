@@ -7,7 +7,7 @@ from typing import Optional
 from ..base_logger import make_logger
 from ..config import JobmanConfig, load_config
 from ..display import Displayer, DisplayLevel, DisplayStyle
-from ..models import init_db_models
+from ..models import db, init_db_models
 
 
 def display_reset(
@@ -37,12 +37,20 @@ def reset(
     if not logger:
         logger = make_logger()
 
+    # close any connection to the old database before deleting its file, so
+    # the new database is opened fresh below
+    if not db.is_closed():
+        db.close()
     config.db_path.unlink(missing_ok=True)
     logger.warn(f"Ensured old database at {config.db_path} deleted")
 
-    config.stdio_path.mkdir(parents=True, exist_ok=True)
-    shutil.rmtree(config.stdio_path)
-    config.stdio_path.mkdir()
+    # rmtree already deletes through directory file descriptors (unlinkat), so
+    # just tolerate a missing folder instead of creating it only to delete it
+    try:
+        shutil.rmtree(config.stdio_path)
+    except FileNotFoundError:
+        pass
+    config.stdio_path.mkdir(parents=True)
     logger.warn(f"Deleted all stdout/stderr logs from {config.stdio_path}")
 
     init_db_models(config.db_path)
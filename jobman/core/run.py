@@ -63,7 +63,7 @@ def display_run(
         plain_content=str(job.job_id),
         json_content={
             "result": "success",
-            "message": "Job sumitted",
+            "message": "Job submitted",
             "job_id": job.job_id,
         },
         stream=sys.stdout,
@@ -151,21 +151,20 @@ def display_status(
                 run_table.add_column(Run._name_to_display_name(field))
 
             job_runs_sorted = sorted(job_runs, key=lambda r: r.attempt, reverse=True)
+            exit_code_idx = fields.index("exit_code")
+            success_codes = frozenset(job.success_codes)
             for run in job_runs_sorted:
-                field_to_val = dict()
-                for field in fields:
-                    field_to_val[field] = run.pretty[field][1]
+                run_pretty = run.pretty
+                row = [run_pretty[field][1] for field in fields]
 
                 # make completed rows dim and colorize exit codes
                 if run.is_completed():
-                    run_failed = run.exit_code not in job.success_codes
+                    run_failed = run.exit_code not in success_codes
                     exit_code_color = "[red]" if run_failed else "[green]"
-                    field_to_val["exit_code"] = exit_code_color + str(
-                        field_to_val["exit_code"]
-                    )
-                    field_to_val["attempt"] = "[dim]" + str(field_to_val["attempt"])
+                    row[exit_code_idx] = exit_code_color + str(row[exit_code_idx])
+                    row[0] = "[dim]" + str(row[0])
 
-                run_table.add_row(*field_to_val.values())
+                run_table.add_row(*row)
 
             displayer.print(
                 pretty_content=run_table,
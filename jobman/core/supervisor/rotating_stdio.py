@@ -6,11 +6,9 @@ from pathlib import Path
 
 class RotatingIOWrapper(io.TextIOWrapper):
     def __init__(self, file: Path):
-        print("")
         self.fp = RotatingFileHandler(file)
 
     def write(self, line: str) -> int:
-        print("WRITING")
         record = LogRecord(
             name="",
             level=1,
@@ -2,9 +2,9 @@ import logging
 import multiprocessing as mp
 import os
 import random
+import secrets
 import shlex
 import signal
-import string
 import subprocess
 import sys
 import time
@@ -32,8 +32,8 @@ def preproc_cmd(command: Tuple[str, ...]) -> str:
 
 
 def _generate_random_job_id() -> str:
-    id_len = 8
-    return "".join(random.choices(string.hexdigits, k=id_len)).lower()
+    id_bytes = 4
+    return secrets.token_hex(id_bytes)
 
 
 def build_job(
@@ -120,7 +120,6 @@ def get_delay_secs(
 
 def handle(signum: int, stack: Optional[FrameType]) -> None:
     # TODO: kill
-    print("HANDLED!")
     sys.exit(1)
 
 
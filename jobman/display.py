@@ -4,16 +4,40 @@ import sys
 from abc import ABC
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Optional, TextIO, Union
-
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, TextIO, Union
 
 from .exceptions import JobmanError
-from .models import JobmanModelEncoder
 
-stdout = Console()
-stderr = Console(file=sys.stderr)
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+
+@lru_cache(maxsize=2)
+def get_console(stream: TextIO) -> "Console":
+    """
+    Rich console rendering to stderr if stream is stderr, else to stdout. rich
+    is imported on first use so that displayers that don't need it never pay
+    its import cost.
+    """
+    from rich.console import Console
+
+    if stream == sys.stderr:
+        return Console(file=sys.stderr)
+    return Console()
+
+
+def to_json(content: Any) -> str:
+    """
+    Serialize content, including jobman models, to indented JSON.
+    """
+    from .models import JobmanModelEncoder
+
+    if isinstance(content, str):
+        # assume strings are already JSON formatted
+        content = json.loads(content)
+    return json.dumps(content, cls=JobmanModelEncoder, indent=2)
 
 
 class DisplayLevel(Enum):
@@ -38,7 +62,7 @@ class Displayer(ABC):
 
     def print(
         self,
-        pretty_content: Optional[Union[str, Table]],
+        pretty_content: Optional[Union[str, "Table"]],
         plain_content: Optional[str],
         json_content: Optional[Any],
         stream: TextIO,
@@ -47,13 +71,26 @@ class Displayer(ABC):
     ) -> None:
         raise NotImplementedError("Displayer class is an ABC")
 
+    def print_exception(self, e: Exception) -> None:
+        """
+        Display an interpretable error message for the specified exception.
+        """
+        self.print(
+            pretty_content=f"ERROR! {e}",
+            plain_content=f"ERROR! {e}",
+            json_content={"result": "error", "message": str(e)},
+            stream=sys.stderr,
+            level=DisplayLevel.ALWAYS,
+            style=DisplayStyle.FAILURE,
+        )
+
 
 class SimpleDisplayer(Displayer):
     """Displays output unformatted to stdout."""
 
     def print(  # type: ignore[no-untyped-def]
         self,
-        pretty_content: Optional[Union[str, Table]],
+        pretty_content: Optional[Union[str, "Table"]],
         plain_content: Optional[str],
         json_content: Optional[Any],
         *args,
@@ -67,7 +104,7 @@ class AntiDisplayer(Displayer):
 
     def print(  # type: ignore[no-untyped-def]
         self,
-        pretty_content: Optional[Union[str, Table]],
+        pretty_content: Optional[Union[str, "Table"]],
         plain_content: Optional[str],
         json_content: Optional[Any],
         *args,
@@ -76,6 +113,30 @@ class AntiDisplayer(Displayer):
         pass
 
 
+@dataclass
+class JsonDisplayer(Displayer):
+    """Displays only JSON content, without rich formatting."""
+
+    quiet: bool
+
+    def print(  # type: ignore[no-untyped-def]
+        self,
+        pretty_content: Optional[Union[str, "Table"]],
+        plain_content: Optional[str],
+        json_content: Optional[Any],
+        stream: TextIO,
+        level: Optional[DisplayLevel] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        if json_content is None:
+            return
+        if self.quiet and level in [DisplayLevel.NORMAL, DisplayLevel.DETAIL]:
+            return
+
+        print(to_json(json_content), file=stream)
+
+
 @dataclass
 class RichDisplayer(Displayer):
     """Displays richly formatted output."""
@@ -100,7 +161,7 @@ class RichDisplayer(Displayer):
 
     def print(
         self,
-        pretty_content: Optional[Union[str, Table]],
+        pretty_content: Optional[Union[str, "Table"]],
         plain_content: Optional[str],
         json_content: Optional[Any],
         stream: TextIO,
@@ -121,7 +182,7 @@ class RichDisplayer(Displayer):
 
     def _pretty_print(
         self,
-        content: Union[str, Table],
+        content: Union[str, "Table"],
         stream: TextIO,
         level: Optional[DisplayLevel] = DisplayLevel.NORMAL,
         style: Optional[Union[DisplayStyle, str]] = DisplayStyle.NORMAL,
@@ -140,8 +201,7 @@ class RichDisplayer(Displayer):
         else:
             rich_style = ""
 
-        console = stdout if stream == sys.stdout else stderr
-        console.print(content, style=rich_style)
+        get_console(stream).print(content, style=rich_style)
 
     def _plain_print(
         self,
@@ -157,23 +217,4 @@ class RichDisplayer(Displayer):
         stream: TextIO,
         level: Optional[DisplayLevel] = DisplayLevel.NORMAL,
     ) -> None:
-        console = stdout if stream == sys.stdout else stderr
-        if isinstance(content, str):
-            # assume strings are already JSON formatted
-            console.print_json(content)
-        else:
-            # other types get serialized to JSON
-            console.print_json(json.dumps(content, cls=JobmanModelEncoder))
-
-    def print_exception(self, e: Exception) -> None:
-        """
-        Display an interpretable error message for the specified exception.
-        """
-        self.print(
-            pretty_content=f"ERROR! {e}",
-            plain_content=f"ERROR! {e}",
-            json_content={"result": "error", "message": str(e)},
-            stream=sys.stderr,
-            level=DisplayLevel.ALWAYS,
-            style=DisplayStyle.FAILURE,
-        )
+        get_console(stream).print_json(to_json(content))
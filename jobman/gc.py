@@ -1,5 +1,5 @@
 import logging
-import multiprocessing
+import os
 from datetime import datetime
 
 from .config import JobmanConfig
@@ -22,4 +22,41 @@ def gc_logs(config: JobmanConfig, logger: logging.Logger) -> None:
 
 
 def bg_gc_logs(config: JobmanConfig, logger: logging.Logger) -> None:
-    multiprocessing.Process(target=gc_logs, args=(config, logger)).start()
+    """
+    Run gc_logs in a detached child process. Unlike a multiprocessing.Process,
+    the child isn't joined when the parent exits, so the calling command
+    returns as soon as its own work is done.
+    """
+    try:
+        pid = os.fork()
+    except OSError as e:
+        logger.warning(f"Failed to start background GC: {e}")
+        return
+
+    if pid != 0:
+        return
+
+    try:
+        # detach from the parent's session and stdio so that, e.g., a pipe
+        # reading the parent's stdout or stderr closes when the parent exits
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        if devnull > 2:
+            os.close(devnull)
+
+        # the logger's handlers write to the parent's stderr, which the child
+        # no longer has, so drop them rather than format records for devnull
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        logger.addHandler(logging.NullHandler())
+
+        gc_logs(config, logger)
+    except Exception:
+        logger.exception("Background GC failed")
+    finally:
+        # os._exit is preferred over sys.exit so the child doesn't run the
+        # parent's atexit hooks or return into the CLI
+        os._exit(0)
@@ -1,7 +1,9 @@
 import hashlib
 import platform
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_host_id() -> str:
     system_info = platform.uname()
     system_info_str = ";".join(
@@ -1,8 +1,10 @@
 import json
+import os
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from peewee import (
     BooleanField,
@@ -15,7 +17,9 @@ from peewee import (
 )
 from playhouse.shortcuts import model_to_dict  # type: ignore
 from playhouse.sqlite_ext import SqliteExtDatabase  # type: ignore
-from rich.syntax import Syntax
+
+if TYPE_CHECKING:
+    from rich.syntax import Syntax
 
 
 class JobmanDatabase(SqliteExtDatabase):  # type: ignore[misc,no-any-unimported]
@@ -30,6 +34,9 @@ db = JobmanDatabase(
     None,
     pragmas={
         "journal_mode": "wal",
+        # in WAL mode, only checkpoints fsync; commits stay crash-safe and
+        # can only be lost on power failure
+        "synchronous": 1,  # NORMAL
         "cache_size": -1 * 64,  # 64KB
         "foreign_keys": 1,
         "ignore_check_constraints": 0,
@@ -37,10 +44,23 @@ db = JobmanDatabase(
 )
 
 
+# pid of the process that opened the current connection, if any
+_connected_pid: Optional[int] = None
+
+
 def init_db_models(db_path: Path) -> None:
+    global _connected_pid
+
+    # reuse a connection opened by an earlier call in this process. A
+    # connection inherited across a fork isn't safe to share, so a forked child
+    # reconnects
+    if db.database == db_path and not db.is_closed() and _connected_pid == os.getpid():
+        return
+
     db.init(db_path)
     db.connect()
     db.build()
+    _connected_pid = os.getpid()
 
 
 class TimedeltaField(FloatField):
@@ -134,22 +154,29 @@ class JobmanModel(Model):
         database = db
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _name_to_display_name(name: str) -> str:
+        # called for every field of every row by pretty, over a fixed set of
+        # field names
         return name.replace("_", " ").title()
 
     @property
-    def pretty(self) -> Dict[str, Tuple[str, Union[str, Syntax]]]:
+    def pretty(self) -> Dict[str, Tuple[str, Union[str, "Syntax"]]]:
         name_to_pretty = dict()
         for name in self._meta.fields:  # type: ignore[attr-defined]
             pretty_name = self._name_to_display_name(name)
             val = getattr(self, name)
 
-            pretty_val: Union[str, Syntax] = str(val)
+            pretty_val: Union[str, "Syntax"] = str(val)
             if val is None:
                 pretty_val = "-"
             elif name == "command":
                 # fish shell has the best pygments syntax highlighting support
-                # so we use fish highlighting regardless of the parent shell
+                # so we use fish highlighting regardless of the parent shell.
+                # rich is imported here so that loading the models doesn't
+                # pull in rich and pygments
+                from rich.syntax import Syntax
+
                 syntax = Syntax(val, "fish", background_color="default")
                 pretty_val = syntax
             elif name.endswith("_time"):
@@ -217,6 +244,10 @@ class Job(JobmanModel):
     state: int = IntegerField()  # type: ignore[assignment]
     exit_code: Optional[int] = IntegerField(null=True)  # type: ignore[assignment]
 
+    class Meta:
+        # serves ls's per-host listing, newest first
+        indexes = ((("host_id", "start_time"), False),)
+
     def is_failed(self) -> bool:
         return self.exit_code is not None and self.exit_code not in self.success_codes
 
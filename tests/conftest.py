@@ -0,0 +1,16 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from jobman.config import JobmanConfig
+from jobman.models import db, init_db_models
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Iterator[JobmanConfig]:
+    """A config whose database and logs live under a fresh temporary folder."""
+    config = JobmanConfig(storage_path=tmp_path)
+    init_db_models(config.db_path)
+    yield config
+    db.close()
@@ -0,0 +1,64 @@
+import os
+from datetime import timedelta
+
+import pytest
+
+from jobman.cli import strptimedelta
+from jobman.exceptions import JobmanError
+
+
+@pytest.mark.parametrize(
+    "td_str, expected",
+    [
+        ("", timedelta()),
+        ("   ", timedelta()),
+        ("0s", timedelta()),
+        ("30s", timedelta(seconds=30)),
+        ("5m", timedelta(minutes=5)),
+        ("2h", timedelta(hours=2)),
+        ("3d", timedelta(days=3)),
+        ("1w", timedelta(weeks=1)),
+        ("90m", timedelta(minutes=90)),
+        ("1w2d3h4m5s", timedelta(weeks=1, days=2, hours=3, minutes=4, seconds=5)),
+        # units may come in any order and be separated by whitespace
+        ("5s 4m 3h", timedelta(hours=3, minutes=4, seconds=5)),
+        (" 1d ", timedelta(days=1)),
+        ("1d\t2h", timedelta(days=1, hours=2)),
+    ],
+)
+def test_strptimedelta_accepts(td_str: str, expected: timedelta) -> None:
+    assert strptimedelta(td_str) == expected
+
+
+@pytest.mark.parametrize(
+    "td_str, message",
+    [
+        ("1", "Got uninterpretable characters '1'"),
+        ("1x", "Got uninterpretable characters '1x'"),
+        ("h", "Got uninterpretable characters 'h'"),
+        ("1h x", "Got uninterpretable characters 'x'"),
+        ("1h2", "Got uninterpretable characters '2'"),
+        ("1.5h", "Got uninterpretable characters '1.'"),
+        ("-1h", "Got uninterpretable characters '-'"),
+        ("1H", "Got uninterpretable characters '1H'"),
+        ("1hh", "Got uninterpretable characters 'h'"),
+        ("10:00", "Got uninterpretable characters '10:00'"),
+        # leading zeros aren't part of a value
+        ("07h", "Got uninterpretable characters '0'"),
+        ("1d 007s", "Got uninterpretable characters '00'"),
+        # only ASCII digits make a value
+        ("٣d", "Got uninterpretable characters '٣d'"),
+        ("1h1h", "Got multiple values for 'h'"),
+        ("1m 2s 3m", "Got multiple values for 'm'"),
+        # repeated units are reported in w, d, h, m, s order
+        ("1h1h1d1d", "Got multiple values for 'd'"),
+        ("1h1h x", "Got multiple values for 'h'"),
+        ("9" * 5000 + "s", "must be an integer"),
+        ("99999999999w", "Duration is too large"),
+        ("999999999999999999999s", "Duration is too large"),
+    ],
+)
+def test_strptimedelta_rejects(td_str: str, message: str) -> None:
+    with pytest.raises(JobmanError, match=message) as exc_info:
+        strptimedelta(td_str)
+    assert exc_info.value.exit_code == os.EX_USAGE
@@ -0,0 +1,161 @@
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from jobman import config as config_module
+from jobman.config import DEFAULT_STORAGE_PATH, JobmanConfig
+from jobman.exceptions import JobmanError
+
+
+def test_from_dict_empty_uses_defaults() -> None:
+    config = JobmanConfig.from_dict({})
+    assert config.storage_path == DEFAULT_STORAGE_PATH
+    assert config.gc_expiry == timedelta(days=7)
+    assert config.notification_sinks == []
+    assert config.db_path == DEFAULT_STORAGE_PATH / "jobman.db"
+    assert config.stdio_path == DEFAULT_STORAGE_PATH / "stdio"
+
+
+def test_from_dict_all_keys() -> None:
+    sinks = [{"type": "email", "address": "me@example.com"}]
+    config = JobmanConfig.from_dict(
+        {"storage_path": "/tmp/jobman", "gc_expiry": 60, "notification_sinks": sinks}
+    )
+    assert config.storage_path == Path("/tmp/jobman")
+    assert config.db_path == Path("/tmp/jobman/jobman.db")
+    assert config.stdio_path == Path("/tmp/jobman/stdio")
+    assert config.gc_expiry == timedelta(seconds=60)
+    assert config.notification_sinks == sinks
+
+
+def test_from_dict_expands_user() -> None:
+    config = JobmanConfig.from_dict({"storage_path": "~/jobman"})
+    assert config.storage_path == Path("~/jobman").expanduser()
+
+
+@pytest.mark.parametrize(
+    "config_dict",
+    [
+        {"unknown": 1},
+        {"storage_path": "/tmp", "unknown": 1},
+        # derived paths aren't settable
+        {"db_path": "/tmp/jobman.db"},
+        {"stdio_path": "/tmp/stdio"},
+    ],
+)
+def test_from_dict_rejects_unknown_keys(config_dict: Any) -> None:
+    with pytest.raises(ValueError, match="unknown keys"):
+        JobmanConfig.from_dict(config_dict)
+
+
+@pytest.mark.parametrize(
+    "config_dict",
+    [
+        ["storage_path"],
+        "storage_path: /tmp",
+        {"storage_path": 1},
+        {"storage_path": None},
+        {"notification_sinks": {"type": "email"}},
+        {"notification_sinks": [{"type": 1}]},
+        {"notification_sinks": ["email"]},
+    ],
+)
+def test_from_dict_rejects_invalid_values(config_dict: Any) -> None:
+    with pytest.raises(ValueError):
+        JobmanConfig.from_dict(config_dict)
+
+
+@pytest.mark.parametrize(
+    "gc_expiry, expected",
+    [
+        (timedelta(hours=1), timedelta(hours=1)),
+        (3600, timedelta(hours=1)),
+        (1.5, timedelta(seconds=1.5)),
+        ("P7D", timedelta(days=7)),
+        ("-P1D", timedelta(days=-1)),
+        ("P1W", timedelta(weeks=1)),
+        ("P1Y", timedelta(days=365)),
+        ("P2M", timedelta(days=60)),
+        ("PT1H30M", timedelta(hours=1, minutes=30)),
+        ("P1DT2H3M4.5S", timedelta(days=1, hours=2, minutes=3, seconds=4.5)),
+        ("P1.5D", timedelta(days=1.5)),
+        ("10:00:00", timedelta(hours=10)),
+        ("00:10", timedelta(minutes=10)),
+        ("25:00:00", timedelta(hours=25)),
+        ("1:00:00.25", timedelta(hours=1, seconds=0.25)),
+        ("1 day", timedelta(days=1)),
+        ("2 days, 1:00:00", timedelta(days=2, hours=1)),
+        ("1:00:00", timedelta(hours=1)),
+        ("1d", timedelta(days=1)),
+        ("1 d", timedelta(days=1)),
+        ("1d 10:00", timedelta(days=1, hours=10)),
+        ("1 day, 23:59:59", timedelta(days=1, hours=23, minutes=59, seconds=59)),
+        ("-1 day, 10:00", -timedelta(days=1, hours=10)),
+    ],
+)
+def test_from_dict_gc_expiry(gc_expiry: Any, expected: timedelta) -> None:
+    assert JobmanConfig.from_dict({"gc_expiry": gc_expiry}).gc_expiry == expected
+
+
+@pytest.mark.parametrize(
+    "gc_expiry",
+    [
+        None,
+        True,
+        [],
+        "",
+        " ",
+        "P",
+        "PT",
+        "1:2:3",
+        "1e3",
+        "abc",
+        "7x",
+        # neither numeric strings nor the CLI's duration syntax are durations
+        # here, as neither was for pydantic
+        "3600",
+        "1w2d",
+        "7:12",
+        "03:67",
+        "1 day, 24:00",
+    ],
+)
+def test_from_dict_rejects_invalid_gc_expiry(gc_expiry: Any) -> None:
+    with pytest.raises(ValueError, match="expected a duration"):
+        JobmanConfig.from_dict({"gc_expiry": gc_expiry})
+
+
+def test_from_dict_rejects_too_large_gc_expiry() -> None:
+    with pytest.raises(ValueError, match="too large"):
+        JobmanConfig.from_dict({"gc_expiry": "P99999999999Y"})
+
+
+def test_load_config_reports_invalid_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "config.yml").write_text("gc_expiry: forever\n")
+    monkeypatch.setattr(config_module, "CONFIG_HOME", tmp_path)
+    config_module.load_config.cache_clear()
+    try:
+        with pytest.raises(JobmanError, match="Invalid config file"):
+            config_module.load_config()
+    finally:
+        config_module.load_config.cache_clear()
+
+
+def test_load_config_reads_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "config.yml").write_text(
+        f"storage_path: {tmp_path / 'storage'}\ngc_expiry: P1D\n"
+    )
+    monkeypatch.setattr(config_module, "CONFIG_HOME", tmp_path)
+    config_module.load_config.cache_clear()
+    try:
+        config = config_module.load_config()
+    finally:
+        config_module.load_config.cache_clear()
+    assert config.storage_path == tmp_path / "storage"
+    assert config.gc_expiry == timedelta(days=1)
@@ -0,0 +1,135 @@
+import os
+import signal
+import subprocess
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from jobman.config import JobmanConfig
+from jobman.core.kill import kill
+from jobman.host import get_host_id
+from jobman.models import Job, JobState, Run, RunState
+
+
+def add_job(job_id: str, config: JobmanConfig, pid: Optional[int] = None) -> None:
+    """Add a job, with a running run for pid if one is given."""
+    Job.create(
+        job_id=job_id,
+        host_id=get_host_id(),
+        command="sleep 60",
+        start_time=datetime.now(),
+        state=(JobState.COMPLETE if pid is None else JobState.RUNNING).value,
+        success_codes=(0,),
+    )
+    if pid is not None:
+        Run.create(
+            job=job_id,
+            attempt=0,
+            log_path=config.stdio_path / job_id / "0",
+            pid=pid,
+            start_time=datetime.now(),
+            state=RunState.RUNNING.value,
+        )
+
+
+@pytest.fixture
+def live_pid() -> Iterator[int]:
+    proc = subprocess.Popen(["sleep", "60"])
+    yield proc.pid
+    proc.kill()
+    proc.wait()
+
+
+@pytest.fixture
+def dead_pid() -> int:
+    proc = subprocess.Popen(["true"])
+    proc.wait()
+    return proc.pid
+
+
+@pytest.fixture
+def signals_sent(monkeypatch: pytest.MonkeyPatch) -> List[Tuple[int, int]]:
+    """Records each signal kill sends, other than existence checks."""
+    sent: List[Tuple[int, int]] = []
+    os_kill = os.kill
+
+    def record_kill(pid: int, sig: int) -> None:
+        if sig != 0:
+            sent.append((pid, sig))
+        os_kill(pid, sig)
+
+    monkeypatch.setattr(os, "kill", record_kill)
+    return sent
+
+
+def test_kill_partitions_jobs(
+    config: JobmanConfig,
+    live_pid: int,
+    dead_pid: int,
+    signals_sent: List[Tuple[int, int]],
+) -> None:
+    add_job("aaaa0001", config, pid=live_pid)
+    add_job("aaaa0002", config, pid=dead_pid)
+    add_job("aaaa0003", config)
+
+    result = kill(
+        ("aaaa0001", "aaaa0002", "aaaa0003", "nope0001"),
+        signal="SIGTERM",
+        config=config,
+    )
+
+    assert result.killed_run_ids == [("aaaa0001", 0)]
+    assert result.failed_killed_run_ids == []
+    assert result.nonrunning_job_ids == ["aaaa0002", "aaaa0003"]
+    assert result.nonexistent_job_ids == ["nope0001"]
+    assert signals_sent == [(live_pid, signal.SIGTERM)]
+
+    # only the signalled run is marked killed, and kill leaves run and job
+    # states for the supervisor to update
+    assert Run.get(Run.job == "aaaa0001").killed
+    assert not Run.get(Run.job == "aaaa0002").killed
+    assert Run.get(Run.job == "aaaa0002").state == RunState.RUNNING.value
+    assert Job.get(Job.job_id == "aaaa0002").state == JobState.RUNNING.value
+
+
+def test_kill_does_not_signal_exited_process(
+    config: JobmanConfig, dead_pid: int, signals_sent: List[Tuple[int, int]]
+) -> None:
+    add_job("aaaa0001", config, pid=dead_pid)
+
+    result = kill(("aaaa0001",), config=config)
+
+    assert signals_sent == []
+    assert result.killed_run_ids == []
+    assert result.failed_killed_run_ids == []
+    assert result.nonrunning_job_ids == ["aaaa0001"]
+
+
+def test_kill_preserves_caller_order(config: JobmanConfig) -> None:
+    for job_id in ["aaaa0001", "aaaa0002", "aaaa0003", "aaaa0004", "aaaa0005"]:
+        add_job(job_id, config)
+
+    result = kill(
+        ("aaaa0005", "nope0002", "aaaa0001", "nope0001", "aaaa0003", "aaaa0001"),
+        config=config,
+    )
+
+    assert result.nonrunning_job_ids == ["aaaa0005", "aaaa0001", "aaaa0003"]
+    assert result.nonexistent_job_ids == ["nope0002", "nope0001"]
+
+
+def test_kill_allow_retries_leaves_run_unmarked(
+    config: JobmanConfig, live_pid: int, signals_sent: List[Tuple[int, int]]
+) -> None:
+    add_job("aaaa0001", config, pid=live_pid)
+
+    result = kill(("aaaa0001",), signal="SIGTERM", allow_retries=True, config=config)
+
+    assert result.killed_run_ids == [("aaaa0001", 0)]
+    assert signals_sent == [(live_pid, signal.SIGTERM)]
+    assert not Run.get(Run.job == "aaaa0001").killed
+
+
+def test_kill_without_job_ids(config: JobmanConfig) -> None:
+    assert kill((), config=config) == ([], [], [], [])
@@ -0,0 +1,98 @@
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from jobman.config import JobmanConfig
+from jobman.core.purge import purge
+from jobman.host import get_host_id
+from jobman.models import Job, JobState, Run, RunState
+
+
+def add_job(job_id: str, state: JobState, config: JobmanConfig) -> Path:
+    """Add a job with one run, and return the job's log folder."""
+    Job.create(
+        job_id=job_id,
+        host_id=get_host_id(),
+        command="true",
+        start_time=datetime.now(),
+        state=state.value,
+        success_codes=(0,),
+    )
+    job_log_path = config.stdio_path / job_id
+    Run.create(
+        job=job_id,
+        attempt=0,
+        log_path=job_log_path / "0",
+        start_time=datetime.now(),
+        state=(
+            RunState.COMPLETE if state == JobState.COMPLETE else RunState.RUNNING
+        ).value,
+    )
+    (job_log_path / "0").mkdir(parents=True)
+    (job_log_path / "0" / "stdout").write_text("out\n")
+    return job_log_path
+
+
+def job_ids_in_db() -> List[str]:
+    return sorted(job.job_id for job in Job.select(Job.job_id))
+
+
+def run_job_ids_in_db() -> List[str]:
+    return sorted(run.job.job_id for run in Run.select(Run, Job).join(Job))
+
+
+@pytest.mark.parametrize("metadata", [False, True])
+def test_purge_mixed_jobs(config: JobmanConfig, metadata: bool) -> None:
+    running_path = add_job("aaaa0001", JobState.RUNNING, config)
+    finished_path = add_job("aaaa0002", JobState.COMPLETE, config)
+    untouched_path = add_job("aaaa0003", JobState.COMPLETE, config)
+
+    result = purge(
+        ("nope0001", "aaaa0002", "aaaa0001"), metadata=metadata, config=config
+    )
+
+    assert result.nonexistent_job_ids == ["nope0001"]
+    assert result.purged_job_ids == ["aaaa0002"]
+    assert result.skipped_job_ids == ["aaaa0001"]
+
+    # only the finished job's logs are deleted
+    assert not finished_path.exists()
+    assert running_path.exists()
+    assert untouched_path.exists()
+
+    # and its rows only go too when metadata is purged
+    remaining = (
+        ["aaaa0001", "aaaa0003"] if metadata else ["aaaa0001", "aaaa0002", "aaaa0003"]
+    )
+    assert job_ids_in_db() == remaining
+    assert run_job_ids_in_db() == remaining
+
+
+def test_purge_all_skips_running_jobs(config: JobmanConfig) -> None:
+    running_path = add_job("aaaa0001", JobState.RUNNING, config)
+    finished_paths = [
+        add_job(job_id, JobState.COMPLETE, config)
+        for job_id in ["aaaa0002", "aaaa0003"]
+    ]
+
+    result = purge((), _all=True, metadata=True, config=config)
+
+    assert result.nonexistent_job_ids == []
+    assert sorted(result.purged_job_ids) == ["aaaa0002", "aaaa0003"]
+    assert result.skipped_job_ids == ["aaaa0001"]
+    assert running_path.exists()
+    assert not any(path.exists() for path in finished_paths)
+    assert job_ids_in_db() == ["aaaa0001"]
+    assert run_job_ids_in_db() == ["aaaa0001"]
+
+
+def test_purge_tolerates_missing_log_folder(config: JobmanConfig) -> None:
+    shutil.rmtree(add_job("aaaa0001", JobState.COMPLETE, config))
+
+    result = purge(("aaaa0001",), metadata=True, config=config)
+
+    assert result.purged_job_ids == ["aaaa0001"]
+    assert job_ids_in_db() == []